@@ -1,6 +1,7 @@
 """Pytest configuration and fixtures for evaluation tests."""
 
 import os
+import sys
 from pathlib import Path
 
 import pytest
@@ -8,6 +9,9 @@ from dotenv import load_dotenv
 
 ROOTDIR: str = str(Path(__file__).resolve().parents[1])
 
+# Cache key of a case that runs under EVAL_INCREMENTAL=1
+INCREMENTAL_KEY = pytest.StashKey[str]()
+
 
 def get_agent_config():
     prompts_file = os.getenv("agent_prompts_file")
@@ -140,14 +144,47 @@ def get_llm_config():
     return dict(model_id=model_id, temperature=temperature)
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--with-db",
+        action="store_true",
+        default=False,
+        help="Save evaluation results to the evaluation database",
+    )
+    parser.addoption(
+        "--no-judge-cache",
+        action="store_true",
+        default=False,
+        help="Ignore cached judge verdicts and store fresh ones",
+    )
+    parser.addoption(
+        "--rag-cache",
+        action="store_true",
+        default=False,
+        help="Replay embed and rerank responses from the on-disk RAG cache",
+    )
+
+
 def pytest_configure(config):
     """Set up environment variables before tests run."""
+    # Skip writing .pyc files, eval runs do not benefit from them
+    sys.dont_write_bytecode = True
+
     # Load .env file for evaluation tests
     load_dotenv(".env", override=True)
 
     # Set testing environment
     os.environ["IS_TESTING"] = "true"
 
+    if config.getoption("--no-judge-cache"):
+        os.environ["JUDGE_CACHE_OVERWRITE"] = "1"
+
+    if config.getoption("--rag-cache"):
+        os.environ["EVALS_RAG_CACHE"] = "1"
+
+    if not config.getoption("--with-db"):
+        return
+
     # Set database connection for evaluation tests
     try:
         db_config = get_database_config()
@@ -163,12 +200,52 @@ def pytest_configure(config):
 
 def pytest_unconfigure(config):
     """Clean up after tests complete."""
+    from evals.utils import close_evaluation_databases
+
+    close_evaluation_databases()
+
     # Optionally remove the environment variable after tests
     if "IS_TESTING" in os.environ:
         del os.environ["IS_TESTING"]
 
 
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Remember passed cases of incremental runs."""
+    outcome = yield
+    report = outcome.get_result()
+
+    key = item.stash.get(INCREMENTAL_KEY, None)
+    if key is not None and report.when == "call" and report.passed:
+        from evals.incremental import record_pass
+
+        record_pass(key)
+
+
 # You can also add shared fixtures here
+@pytest.fixture(autouse=True)
+def skip_unchanged(request):
+    """
+    Skip cases that passed before, if EVAL_INCREMENTAL=1.
+
+    A case is rerun once its fixture, its test module, the agent code, the
+    prompt files or the model settings change.
+    """
+    from evals.incremental import get_case_key, has_passed, is_incremental
+
+    callspec = getattr(request.node, "callspec", None)
+    if not is_incremental() or callspec is None or "fixture" not in callspec.params:
+        return
+
+    key = get_case_key(
+        request.node.nodeid, request.node.path, callspec.params["fixture"]
+    )
+    if has_passed(key):
+        pytest.skip("unchanged since last pass")
+
+    request.node.stash[INCREMENTAL_KEY] = key
+
+
 @pytest.fixture(scope="session")
 def test_environment():
     """Ensure test environment is properly configured."""
@@ -178,10 +255,21 @@ def test_environment():
 
 @pytest.fixture(scope="session")
 def rag_adapter():
-    """Provide a RAG adapter instance for tests."""
-    from src.agent.adapters import rag
+    """
+    Provide a RAG adapter instance for tests.
+
+    The services are called directly by default. --rag-cache or
+    EVALS_RAG_CACHE=1 caches embed and rerank responses on disk, so stale
+    responses are only replayed on request.
+    """
+    if os.getenv("EVALS_RAG_CACHE") != "1":
+        from src.agent.adapters import rag
+
+        return rag.BaseRAG(get_rag_config())
 
-    return rag.BaseRAG(get_rag_config())
+    from evals.rag_cache import CachingRAG
+
+    return CachingRAG(get_rag_config())
 
 
 @pytest.fixture(scope="session")
@@ -190,6 +278,14 @@ def llm_config():
     return get_llm_config()
 
 
+@pytest.fixture(scope="session")
+def llm(llm_config):
+    """Provide one LLM client shared by all tests."""
+    from src.agent.adapters.llm import LLM
+
+    return LLM(llm_config)
+
+
 @pytest.fixture(scope="session")
 def rag_config():
     """Provide RAG configuration for tests."""
@@ -208,6 +304,44 @@ def tools_config():
     return get_tools_config()
 
 
+@pytest.fixture(scope="module")
+def tools(tools_config):
+    """
+    Provide one tool agent per test module.
+
+    Built on first use in each worker, like the single Tools instance the
+    agent adapter keeps for all questions.
+    """
+    from src.agent.adapters import agent_tools
+
+    return agent_tools.Tools(tools_config)
+
+
+@pytest.fixture(scope="session")
+def db_schema():
+    """Provide the evaluation database schema, parsed once per session."""
+    from evals.utils import load_database_schema
+
+    return load_database_schema(
+        Path(__file__).parent / "sql_agent", "schema/schema.json"
+    )
+
+
+@pytest.fixture(scope="session")
+def optional_db_schema(request):
+    """
+    Provide the schema for tests that also run without it.
+
+    Scenario checks work without SQL routing context, so a missing
+    schema.json gives None here. The SQL stage tests use db_schema and fail.
+    """
+    schema_path = Path(__file__).parent / "sql_agent" / "schema" / "schema.json"
+    if not schema_path.is_file():
+        return None
+
+    return request.getfixturevalue("db_schema")
+
+
 @pytest.fixture(scope="session")
 def test_notifications():
     """Provide a CollectingNotifications instance for tests."""
@@ -235,9 +369,15 @@ def test_app(test_notifications):
     return app
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_client(test_app):
-    """Provide a test client with CollectingNotifications."""
+    """
+    Provide a test client with CollectingNotifications.
+
+    The client is entered once per session, so all requests share one event
+    loop thread and background tasks keep running between requests.
+    """
     from fastapi.testclient import TestClient
 
-    return TestClient(test_app)
+    with TestClient(test_app) as client:
+        yield client
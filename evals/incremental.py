@@ -0,0 +1,130 @@
+"""Skip eval cases that passed before with unchanged inputs and code."""
+
+import functools
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from evals.judge_cache import JudgeCache, make_cache_key
+
+ROOTDIR = Path(__file__).resolve().parents[1]
+
+# Settings that change what the agent answers without touching the code
+SOURCE_ENV_VARS = (
+    "agent_prompts_file",
+    "sql_prompts_file",
+    "scenario_prompts_file",
+    "tools_prompts_file",
+    "guardrails_prompts_file",
+    "llm_model_id",
+    "llm_temperature",
+    "tools_model_id",
+    "guardrails_model_id",
+)
+
+# Files whose content decides whether a stored pass still holds
+SOURCE_FILES = {
+    "src/agent": ("*.py", "*.yaml"),
+    "evals": ("*.py", "*.yaml", "*.yml", "*.json"),
+}
+
+
+def is_incremental() -> bool:
+    """Incremental runs are opt-in with EVAL_INCREMENTAL=1."""
+    return os.getenv("EVAL_INCREMENTAL", "0") == "1"
+
+
+def get_incremental_cache_dir() -> Path:
+    """Get the passed case cache directory from environment variable or use default."""
+    cache_dir = os.environ.get("EVALS_INCREMENTAL_CACHE_DIR")
+    if cache_dir:
+        return Path(cache_dir)
+
+    # Default: evals/.incremental_cache relative to this file
+    return Path(__file__).parent / ".incremental_cache"
+
+
+class PassedCache(JudgeCache):
+    """
+    SQLite backed store of eval cases that passed.
+
+    Set PASSED_CACHE_OVERWRITE=1 to run every case again.
+    """
+
+    filename = "passed.sqlite"
+    overwrite_env = "PASSED_CACHE_OVERWRITE"
+
+
+@functools.cache
+def get_passed_cache() -> PassedCache:
+    """Passed case store shared by all tests in this process."""
+    return PassedCache(get_incremental_cache_dir())
+
+
+def is_source_file(path: Path, rootdir: Path) -> bool:
+    """Leave out caches, reports and other generated files."""
+    return not any(
+        part.startswith(".") or part in ("__pycache__", "reports")
+        for part in path.relative_to(rootdir).parts
+    )
+
+
+def compute_source_digest(rootdir: Path) -> str:
+    """
+    Hash the agent code, the eval harness, prompt files and model settings.
+
+    The harness covers the judge, conftest, test modules and fixtures, so
+    changing a threshold or an expected answer invalidates every stored pass.
+    """
+    digest = hashlib.sha256()
+
+    files = sorted(
+        path
+        for directory, patterns in SOURCE_FILES.items()
+        for pattern in patterns
+        for path in (rootdir / directory).rglob(pattern)
+        if is_source_file(path, rootdir)
+    )
+    for name in SOURCE_ENV_VARS:
+        value = os.getenv(name, "")
+        digest.update(f"{name}={value}\n".encode())
+
+        if name.endswith("_prompts_file") and value:
+            files.append(rootdir / value)
+
+    for path in files:
+        if path.is_file():
+            digest.update(str(path.relative_to(rootdir)).encode())
+            digest.update(path.read_bytes())
+
+    return digest.hexdigest()
+
+
+@functools.cache
+def get_source_digest() -> str:
+    """Source digest of this checkout, computed once per process."""
+    return compute_source_digest(ROOTDIR)
+
+
+def get_case_key(nodeid: str, test_file: Path, fixture: Any) -> str:
+    """Key one parametrized case by its fixture, test module and the source digest."""
+    return make_cache_key(
+        {
+            "nodeid": nodeid,
+            "fixture": fixture,
+            "test_file": hashlib.sha256(test_file.read_bytes()).hexdigest(),
+            "source": get_source_digest(),
+        }
+    )
+
+
+def has_passed(key: str) -> bool:
+    """Return whether the case passed before with the same key."""
+    return get_passed_cache().get(key) is not None
+
+
+def record_pass(key: str) -> None:
+    """Remember that the case passed, together with the time of the run."""
+    get_passed_cache().set(key, str(int(time.time())))
@@ -0,0 +1,77 @@
+"""On-disk cache for LLM judge verdicts."""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+def get_judge_cache_dir() -> Path:
+    """Get the judge cache directory from environment variable or use default."""
+    cache_dir = os.environ.get("EVALS_JUDGE_CACHE_DIR")
+    if cache_dir:
+        return Path(cache_dir)
+
+    # Default: evals/.judge_cache relative to this file
+    return Path(__file__).parent / ".judge_cache"
+
+
+def make_cache_key(payload: Dict[str, Any]) -> str:
+    """Stable SHA-256 key for a judge input."""
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+class JudgeCache:
+    """
+    SQLite backed key-value store for serialized judge results.
+
+    Unchanged judge inputs return the stored verdict, so repeated eval runs
+    do not spend tokens on cases that were already judged.
+    Set JUDGE_CACHE_OVERWRITE=1 to ignore stored verdicts and refresh them.
+
+    Methods:
+        - get(key): Return the stored value or None.
+        - set(key, value): Store a value.
+    """
+
+    filename = "judge.sqlite"
+    overwrite_env = "JUDGE_CACHE_OVERWRITE"
+
+    def __init__(self, cache_dir: Optional[Path] = None, overwrite: bool = None):
+        cache_dir = cache_dir or get_judge_cache_dir()
+        cache_dir.mkdir(exist_ok=True, parents=True)
+
+        if overwrite is None:
+            overwrite = os.getenv(self.overwrite_env, "0") == "1"
+
+        self.overwrite = overwrite
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(cache_dir / self.filename, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS verdicts (key TEXT PRIMARY KEY, value TEXT)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        if self.overwrite:
+            return None
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM verdicts WHERE key = ?", (key,)
+            ).fetchone()
+
+        return row[0] if row else None
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO verdicts (key, value) VALUES (?, ?)",
+                (key, value),
+            )
+            self._conn.commit()
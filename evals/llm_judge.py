@@ -1,11 +1,20 @@
 """Simplified LLM Judge for evaluating test responses."""
 
-from dataclasses import dataclass
-from typing import Dict, Optional
-from pydantic import BaseModel, Field
+import functools
+import hashlib
+import os
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from loguru import logger
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError, computed_field
 
-from src.agent.adapters.llm import LLM
-from src.agent.config import get_llm_config
+from evals.judge_cache import JudgeCache, make_cache_key
+from evals.rate_limit import RateLimiterConfig, TokenBucket
+
+# The LLM stack (litellm, instructor, langfuse) is slow to import and only
+# needed once a judge is built, so it is imported lazily
+if TYPE_CHECKING:
+    from src.agent.adapters.llm import LLM
 
 
 class JudgeScores(BaseModel):
@@ -18,6 +27,14 @@ class JudgeScores(BaseModel):
         ge=0, le=10, description="Absence of hallucination (10=none)"
     )
 
+    @computed_field
+    @property
+    def average_score(self) -> float:
+        """Mean of all scoring dimensions."""
+        return (
+            self.accuracy + self.relevance + self.completeness + self.hallucination
+        ) / 4
+
 
 class JudgeResult(BaseModel):
     """Result from LLM judge evaluation."""
@@ -28,6 +45,10 @@ class JudgeResult(BaseModel):
     passed: bool = Field(description="Whether the response passes")
 
 
+# Built once, cached verdicts are validated straight from their JSON text
+JUDGE_RESULT_ADAPTER = TypeAdapter(JudgeResult)
+
+
 class JudgeCriteria(BaseModel):
     """Criteria for evaluation."""
 
@@ -37,15 +58,197 @@ class JudgeCriteria(BaseModel):
     hallucination_threshold: float = Field(default=8.0, ge=0, le=10)
 
 
+class JudgeRequest(BaseModel):
+    """A single judge input, keyed for the verdict cache."""
+
+    question: str
+    expected: str
+    actual: str
+    criteria: Optional[JudgeCriteria] = None
+    test_type: str = "general"
+
+
+# Static prompt parts, built once instead of on every judge call
+EVALUATION_DIMENSIONS = """1. Accuracy: How factually correct is the actual response?
+2. Relevance: Does it answer the question?
+3. Completeness: Is the answer complete?
+4. Hallucination: Rate absence of made-up info (10=no hallucination)"""
+
+JUDGE_PROMPT_TEMPLATE = f"""You are evaluating an AI response.
+
+Question: {{question}}
+Expected Response: {{expected}}
+Actual Response: {{actual}}
+
+Evaluate on these dimensions (0-10):
+{EVALUATION_DIMENSIONS}
+
+Provide scores and brief reasoning for each dimension, then an overall assessment.
+"""
+
+# Part of the verdict cache key, so editing a prompt invalidates cached verdicts
+PROMPT_VERSION = hashlib.sha256(JUDGE_PROMPT_TEMPLATE.encode()).hexdigest()[:16]
+
+
+@functools.cache
+def get_judge_rate_limiter() -> TokenBucket:
+    """
+    Token bucket shared by all judges in this process.
+
+    Under pytest-xdist the JUDGE_QPM budget is split evenly across workers.
+    """
+    workers = int(os.getenv("PYTEST_XDIST_WORKER_COUNT", "1"))
+
+    return TokenBucket(
+        RateLimiterConfig(
+            limit=max(1, int(os.getenv("JUDGE_QPM", "500")) // workers),
+            burst=max(1, int(os.getenv("JUDGE_BURST", "10")) // workers),
+        )
+    )
+
+
+@functools.cache
+def get_judge_cache() -> JudgeCache:
+    """Verdict cache shared by all judges in this process."""
+    return JudgeCache()
+
+
 @dataclass
 class LLMJudge:
     """Simplified LLM-based judge."""
 
-    llm: LLM = None
+    llm: "LLM" = None
+    early_stop: bool = field(
+        default_factory=lambda: os.getenv("JUDGE_EARLY_STOP", "0") == "1"
+    )
+    rate_limiter: TokenBucket = None
+    cache: JudgeCache = None
 
     def __post_init__(self):
         if self.llm is None:
+            from src.agent.adapters.llm import LLM
+            from src.agent.config import get_llm_config
+
             self.llm = LLM(get_llm_config())
+        if self.rate_limiter is None:
+            self.rate_limiter = get_judge_rate_limiter()
+        if self.cache is None:
+            self.cache = get_judge_cache()
+
+    def _cache_key(self, request: JudgeRequest) -> str:
+        """Key a judge input together with the judge model and prompt version."""
+        payload = request.model_dump()
+        payload["criteria"] = (request.criteria or JudgeCriteria()).model_dump()
+        payload["model_id"] = getattr(self.llm, "model_id", None)
+        payload["prompt_version"] = PROMPT_VERSION
+
+        return make_cache_key(payload)
+
+    def _get_cached(self, key: str) -> Optional[JudgeResult]:
+        cached = self.cache.get(key)
+        if cached is None:
+            return None
+
+        return JUDGE_RESULT_ADAPTER.validate_json(cached)
+
+    def _set_cached(self, key: str, result: JudgeResult) -> JudgeResult:
+        self.cache.set(key, result.model_dump_json())
+
+        return result
+
+    def _build_prompt(self, question: str, expected: str, actual: str) -> str:
+        """Build the evaluation prompt for the judge."""
+        return JUDGE_PROMPT_TEMPLATE.format(
+            question=question, expected=expected, actual=actual
+        )
+
+    def _failed_dimensions(
+        self, scores: JudgeScores, criteria: JudgeCriteria
+    ) -> List[str]:
+        """Return the score dimensions below their threshold."""
+        thresholds = {
+            "accuracy": criteria.accuracy_threshold,
+            "relevance": criteria.relevance_threshold,
+            "completeness": criteria.completeness_threshold,
+            "hallucination": criteria.hallucination_threshold,
+        }
+
+        return [
+            dimension
+            for dimension, threshold in thresholds.items()
+            if getattr(scores, dimension) < threshold
+        ]
+
+    def _check_thresholds(
+        self, judge_response: JudgeResult, criteria: JudgeCriteria
+    ) -> JudgeResult:
+        """Set the passed flag based on the criteria thresholds."""
+        judge_response.passed = not self._failed_dimensions(
+            judge_response.scores, criteria
+        )
+
+        return judge_response
+
+    def _complete_verdict(self, partial: Any) -> Optional[JudgeResult]:
+        """Validate the last streamed partial, or None if the stream ended incomplete."""
+        if partial is None or partial.scores is None:
+            return None
+
+        try:
+            return JudgeResult.model_validate(
+                {
+                    "scores": {
+                        name: getattr(partial.scores, name)
+                        for name in JudgeScores.model_fields
+                    },
+                    "reasoning": partial.reasoning,
+                    "overall_assessment": partial.overall_assessment,
+                    "passed": partial.passed,
+                }
+            )
+        except ValidationError:
+            return None
+
+    def _stream_judge(
+        self, prompt: str, criteria: JudgeCriteria
+    ) -> Tuple[Optional[JudgeResult], bool]:
+        """
+        Stream the judge response and stop once a score misses its threshold.
+
+        Scores are generated before the reasoning, so they are final as soon
+        as the reasoning starts streaming. Passing cases stream to the end.
+        Returns the verdict, or None if the stream ended incomplete, and
+        whether the stream was stopped early.
+        """
+        partial = None
+        for partial in self.llm.stream(prompt, response_model=JudgeResult):
+            if partial.reasoning is None or partial.scores is None:
+                continue
+
+            values = {
+                name: getattr(partial.scores, name) for name in JudgeScores.model_fields
+            }
+            if None in values.values():
+                continue
+
+            scores = JudgeScores(**values)
+            failed = self._failed_dimensions(scores, criteria)
+            if failed:
+                judge_response = JudgeResult(
+                    scores=scores,
+                    reasoning={},
+                    overall_assessment=(
+                        f"Stopped early: {', '.join(failed)} below threshold"
+                    ),
+                    passed=False,
+                )
+                return judge_response, True
+
+        judge_response = self._complete_verdict(partial)
+        if judge_response is None:
+            return None, False
+
+        return self._check_thresholds(judge_response, criteria), False
 
     def evaluate(
         self,
@@ -59,32 +262,43 @@ class LLMJudge:
         if criteria is None:
             criteria = JudgeCriteria()
 
-        prompt = f"""You are evaluating an AI response.
+        key = self._cache_key(
+            JudgeRequest(
+                question=question,
+                expected=expected,
+                actual=actual,
+                criteria=criteria,
+                test_type=test_type,
+            )
+        )
+        if cached := self._get_cached(key):
+            return cached
 
-Question: {question}
-Expected Response: {expected}
-Actual Response: {actual}
+        prompt = self._build_prompt(question, expected, actual)
 
-Evaluate on these dimensions (0-10):
-1. Accuracy: How factually correct is the actual response?
-2. Relevance: Does it answer the question?
-3. Completeness: Is the answer complete?
-4. Hallucination: Rate absence of made-up info (10=no hallucination)
+        # Use LLM to evaluate, waiting only if the rate budget is spent
+        self.rate_limiter.acquire()
 
-Provide scores and brief reasoning for each dimension, then an overall assessment.
-"""
+        if self.early_stop:
+            judge_response, stopped = self._stream_judge(prompt, criteria)
+
+            # A stopped verdict has no reasoning, so it must not stand in
+            # for a full verdict on a later run
+            if stopped:
+                return judge_response
+            if judge_response is not None:
+                return self._set_cached(key, judge_response)
+
+            logger.warning("Streamed judge verdict was incomplete, asking again")
+            self.rate_limiter.acquire()
 
-        # Use LLM to evaluate
         judge_response = self.llm.use(prompt, response_model=JudgeResult)
 
         # Check if passes thresholds
-        judge_response.passed = all(
-            [
-                judge_response.scores.accuracy >= criteria.accuracy_threshold,
-                judge_response.scores.relevance >= criteria.relevance_threshold,
-                judge_response.scores.completeness >= criteria.completeness_threshold,
-                judge_response.scores.hallucination >= criteria.hallucination_threshold,
-            ]
-        )
+        return self._set_cached(key, self._check_thresholds(judge_response, criteria))
 
-        return judge_response
+
+@functools.cache
+def get_shared_judge() -> LLMJudge:
+    """Judge shared by all eval tests, so the LLM client is built once per process."""
+    return LLMJudge()
@@ -0,0 +1,79 @@
+"""On-disk cache for RAG embedding and reranking calls."""
+
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from evals.judge_cache import JudgeCache, make_cache_key
+from evals.utils import dump_json, load_json
+from src.agent.adapters.rag import BaseRAG
+
+
+def get_rag_cache_dir() -> Path:
+    """Get the RAG cache directory from environment variable or use default."""
+    cache_dir = os.environ.get("EVALS_RAG_CACHE_DIR")
+    if cache_dir:
+        return Path(cache_dir)
+
+    # Default: evals/.rag_cache relative to this file
+    return Path(__file__).parent / ".rag_cache"
+
+
+class RAGCache(JudgeCache):
+    """
+    SQLite backed key-value store for serialized RAG API responses.
+
+    Set RAG_CACHE_OVERWRITE=1 to ignore stored responses and refresh them.
+    """
+
+    filename = "rag.sqlite"
+    overwrite_env = "RAG_CACHE_OVERWRITE"
+
+
+class CachingRAG(BaseRAG):
+    """
+    BaseRAG that reuses stored embed and rerank responses.
+
+    Both calls are keyed by endpoint and input text, so repeated eval runs
+    only reach the RAG services for inputs they have not seen before.
+    Failed calls are not cached. Retrieval always hits the service, since
+    its result depends on the current knowledge base.
+
+    Methods:
+        - embed(self, text: str) -> Dict[str, List[float]]: Embed the text.
+        - rerank(self, question: str, text: str) -> Dict[str, str]: Rerank the text.
+    """
+
+    def __init__(self, kwargs, cache: Optional[RAGCache] = None):
+        super().__init__(kwargs)
+        self.cache = cache or RAGCache(get_rag_cache_dir())
+
+    def _cached(self, payload: Dict, call):
+        key = make_cache_key(payload)
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            return load_json(cached)
+
+        response = call()
+        if response is not None:
+            self.cache.set(key, dump_json(response).decode())
+
+        return response
+
+    def embed(self, text: str) -> Dict[str, List[float]]:
+        return self._cached(
+            {"url": self.embedding_url, "text": text},
+            lambda: super(CachingRAG, self).embed(text),
+        )
+
+    def rerank(self, question: str, text: str) -> Dict[str, str]:
+        return self._cached(
+            {
+                "url": self.ranking_url,
+                "table": self.retrieval_table,
+                "question": question,
+                "text": text,
+            },
+            lambda: super(CachingRAG, self).rerank(question, text),
+        )
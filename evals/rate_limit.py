@@ -0,0 +1,153 @@
+"""Token bucket rate limiting for evaluation API calls."""
+
+import functools
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Tuple
+
+
+class RateLimitType(str, Enum):
+    """Unit of the configured rate limit."""
+
+    RPM = "rpm"
+    RPS = "rps"
+
+
+@dataclass(frozen=True)
+class RateLimiterConfig:
+    """Configuration for a token bucket rate limiter."""
+
+    type: RateLimitType = RateLimitType.RPM
+    limit: int = 500
+    burst: int = 10
+
+    @property
+    def rate_per_second(self) -> float:
+        if self.type is RateLimitType.RPM:
+            return self.limit / 60.0
+        return float(self.limit)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at the configured rate up to `burst`.
+    Callers only wait when the bucket is empty, so bursts below the
+    provider limit run without any delay.
+
+    Methods:
+        - acquire(tokens): Block the current thread until tokens are available.
+    """
+
+    def __init__(self, config: RateLimiterConfig = RateLimiterConfig()):
+        self.config = config
+        self.rate = config.rate_per_second
+        self.capacity = float(max(1, config.burst))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: float) -> float:
+        """Take tokens from the bucket and return how long to wait for them."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            self.tokens -= tokens
+
+            if self.tokens >= 0:
+                return 0.0
+
+            return -self.tokens / self.rate
+
+    def acquire(self, tokens: float = 1) -> float:
+        """
+        Acquire tokens, sleeping only if the bucket is exhausted.
+
+        Returns:
+            wait: float: Seconds spent waiting.
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+# A full agent run (e2e, tool agent) makes several LLM calls per test
+AGENT_RUN_TOKENS = int(os.getenv("AGENT_RUN_TOKENS", "10"))
+
+
+@functools.cache
+def get_agent_rate_limiter() -> TokenBucket:
+    """
+    Token bucket shared by all agent calls in this process.
+
+    Tests acquire before calling the agent, so they only wait once the
+    AGENT_QPM budget is used up. Under pytest-xdist the budget is split
+    evenly across workers.
+    """
+    workers = int(os.getenv("PYTEST_XDIST_WORKER_COUNT", "1"))
+
+    return TokenBucket(
+        RateLimiterConfig(
+            limit=max(1, int(os.getenv("AGENT_QPM", "60")) // workers),
+            burst=max(1, int(os.getenv("AGENT_BURST", "10")) // workers),
+        )
+    )
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """
+    Check whether an error, or any error it was raised from, is a rate limit.
+
+    Agent frameworks wrap provider errors, so the whole exception chain is
+    searched for a 429 status or a RateLimitError.
+    """
+    while error is not None:
+        status_code = getattr(error, "status_code", None)
+        response = getattr(error, "response", None)
+        if status_code is None and response is not None:
+            status_code = getattr(response, "status_code", None)
+
+        if status_code == 429 or type(error).__name__ == "RateLimitError":
+            return True
+
+        error = error.__cause__ or error.__context__
+
+    return False
+
+
+def call_with_backoff(
+    fn: Callable[..., Any],
+    *args,
+    max_retries: int = int(os.getenv("RATE_LIMIT_RETRIES", "3")),
+    base: float = 2.0,
+    **kwargs,
+) -> Tuple[Any, float]:
+    """
+    Call fn and retry with exponential backoff and full jitter on rate limits.
+
+    Other errors are raised right away, so the common path never sleeps.
+
+    Returns:
+        result: Any: The return value of fn.
+        wait: float: Seconds spent backing off.
+    """
+    waited = 0.0
+    for attempt in range(max_retries + 1):
+        try:
+            return fn(*args, **kwargs), waited
+        except Exception as e:
+            if attempt == max_retries or not is_rate_limit_error(e):
+                raise
+
+            wait = random.uniform(0, base ** (attempt + 1))
+            time.sleep(wait)
+            waited += wait
@@ -4,27 +4,18 @@ from pathlib import Path
 
 import pytest
 
+from evals.rate_limit import get_agent_rate_limiter
 from evals.utils import (
     get_model_info_for_test,
-    load_database_schema,
     load_yaml_fixtures,
     save_test_report,
 )
-from src.agent.adapters.llm import LLM
 from src.agent.domain import commands, scenario_model
 
 current_path = Path(__file__).parent
 # Load fixtures from YAML file
 fixtures = load_yaml_fixtures(current_path, "pre_check")
 
-# Load database schema for scenario context
-try:
-    schema = load_database_schema(
-        current_path.parent / "sql_agent", "schema/schema.json"
-    )
-except FileNotFoundError:
-    schema = None
-
 
 class TestScenarioPreCheck:
     """Scenario pre-check guardrails evaluation tests."""
@@ -45,22 +36,24 @@ class TestScenarioPreCheck:
             for fixture_name, fixture in fixtures.items()
         ],
     )
-    def test_eval(self, fixture_name, fixture, agent_config, llm_config):
+    def test_eval(self, fixture_name, fixture, agent_config, llm, optional_db_schema):
         question_text = fixture["question"]
         expected_response = fixture["approved"]
 
         q_id = "eval_scenario_pre_check_" + str(uuid.uuid4())
         # Create scenario command with schema info
         scenario_question = commands.Scenario(
-            question=question_text, q_id=q_id, schema_info=schema
+            question=question_text, q_id=q_id, schema_info=optional_db_schema
         )
 
-        llm = LLM(llm_config)
         agent = scenario_model.ScenarioBaseAgent(
             question=scenario_question,
             kwargs=agent_config,
         )
 
+        # Wait for rate limit budget before calling the LLM
+        get_agent_rate_limiter().acquire()
+
         start_time = time.time()
 
         # Prepare guardrails check
@@ -72,9 +65,6 @@ class TestScenarioPreCheck:
         # Calculate execution time
         execution_time_ms = int((time.time() - start_time) * 1000)
 
-        # Add delay to avoid rate limiting
-        time.sleep(1)
-
         # Extract response
         actual_response = response.approved
 
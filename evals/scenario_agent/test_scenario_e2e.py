@@ -3,10 +3,9 @@ from pathlib import Path
 
 import pytest
 
-from evals.llm_judge import JudgeCriteria, LLMJudge
+from evals.llm_judge import JudgeCriteria, get_shared_judge
 from evals.utils import (
     get_model_info_for_test,
-    load_database_schema,
     load_yaml_fixtures,
     save_test_report,
 )
@@ -16,26 +15,14 @@ current_path = Path(__file__).parent
 # Load fixtures from YAML file
 fixtures = load_yaml_fixtures(current_path, "e2e")
 
-# Load database schema for scenario routing decisions
-try:
-    schema = load_database_schema(
-        current_path.parent / "sql_agent", "schema/schema.json"
-    )
-except FileNotFoundError:
-    # If schema doesn't exist, scenario will work without SQL routing capability
-    schema = None
-
 
 class TestScenarioEndToEnd:
     """Scenario End-to-End evaluation tests using FastAPI endpoint."""
 
-    def setup_method(self):
-        """Initialize LLM Judge for evaluation."""
-        self.judge = LLMJudge()
-
     def setup_class(self):
-        """Setup report file."""
+        """Setup report file and the shared LLM Judge."""
         self.results = []
+        self.judge = get_shared_judge()
 
     def teardown_class(self):
         """Save results to report file."""
@@ -86,23 +73,7 @@ class TestScenarioEndToEnd:
         assert response.json()["status"] == "processing"
 
         # Wait for async processing to complete
-        max_wait_time = 30  # Maximum wait time in seconds
-        wait_interval = 1  # Check interval in seconds
-        elapsed_time = 0
-
-        while elapsed_time < max_wait_time:
-            # Check if we have received a response event
-            session_events = test_notifications.sent.get(session_id, [])
-            has_response = any(
-                isinstance(event, events.Response) or hasattr(event, "response")
-                for event in session_events
-            )
-
-            if has_response:
-                break
-
-            time.sleep(wait_interval)
-            elapsed_time += wait_interval
+        test_notifications.wait_for_response(session_id, timeout=30)
 
         # Extract actual response from collected notifications
         actual_response = self.extract_final_response(session_id, test_notifications)
@@ -117,15 +88,16 @@ class TestScenarioEndToEnd:
         # Calculate execution time
         execution_time_ms = int((time.time() - start_time) * 1000)
 
-        # Add delay to avoid rate limiting
-        time.sleep(1)
+        # Convert once, the same strings go to the judge and the report
+        expected = str(expected_response)
+        actual = str(actual_response)
 
         # Use LLM Judge for evaluation
         criteria = JudgeCriteria(**fixture.get("judge_criteria", {}))
         judge_result = self.judge.evaluate(
             question=question,
-            expected=str(expected_response),
-            actual=str(actual_response),
+            expected=expected,
+            actual=actual,
             criteria=criteria,
             test_type="scenario_e2e",
         )
@@ -134,17 +106,11 @@ class TestScenarioEndToEnd:
         result = {
             "test_name": fixture_name,
             "question": question,
-            "expected": str(expected_response),
-            "actual": str(actual_response),
+            "expected": expected,
+            "actual": actual,
             "passed": judge_result.passed,
             "execution_time_ms": execution_time_ms,
-            "overall_score": (
-                judge_result.scores.accuracy
-                + judge_result.scores.relevance
-                + judge_result.scores.completeness
-                + judge_result.scores.hallucination
-            )
-            / 4,
+            "overall_score": judge_result.scores.average_score,
             "accuracy": judge_result.scores.accuracy,
             "relevance": judge_result.scores.relevance,
             "completeness": judge_result.scores.completeness,
@@ -4,32 +4,26 @@ from pathlib import Path
 
 import pytest
 
-from evals.llm_judge import JudgeCriteria, LLMJudge
+from evals.llm_judge import JudgeCriteria, get_shared_judge
 from evals.utils import (
     get_model_info_for_test,
-    load_database_schema,
     load_yaml_fixtures,
     save_test_report,
 )
-from src.agent.adapters.llm import LLM
 from src.agent.domain import commands, sql_model
 
 current_path = Path(__file__).parent
 # Load fixtures from YAML file
 fixtures = load_yaml_fixtures(current_path, "aggregate")
-schema = load_database_schema(current_path, "schema/schema.json")
 
 
 class TestEvalAggregate:
     """SQL Aggregation evaluation tests."""
 
-    def setup_method(self):
-        """Initialize LLM Judge for evaluation."""
-        self.judge = LLMJudge()
-
     def setup_class(self):
-        """Setup report file."""
+        """Setup report file and the shared LLM Judge."""
         self.results = []
+        self.judge = get_shared_judge()
 
     def teardown_class(self):
         """Save results to report file."""
@@ -43,7 +37,7 @@ class TestEvalAggregate:
             for fixture_name, fixture in fixtures.items()
         ],
     )
-    def test_eval_aggregate(self, fixture_name, fixture, agent_config, llm_config):
+    def test_eval_aggregate(self, fixture_name, fixture, agent_config, llm, db_schema):
         """Run SQL aggregation test with optional LLM judge evaluation."""
 
         # Extract test data - fixture is now the test data directly
@@ -59,7 +53,6 @@ class TestEvalAggregate:
         q_id = f"test_aggregate_{str(uuid.uuid4())}"
         sql_question = commands.SQLQuestion(question=question_text, q_id=q_id)
 
-        llm = LLM(llm_config)
         agent = sql_model.SQLBaseAgent(
             question=sql_question,
             kwargs=agent_config,
@@ -77,7 +70,7 @@ class TestEvalAggregate:
 
         # Set up the construction state with column mappings
         agent.construction.column_mapping = column_mappings
-        agent.construction.schema_info = schema
+        agent.construction.schema_info = db_schema
 
         # Start timing
         start_time = time.time()
@@ -110,15 +103,16 @@ class TestEvalAggregate:
         # Calculate execution time
         execution_time_ms = int((time.time() - start_time) * 1000)
 
-        # Add delay to avoid rate limiting
-        time.sleep(1)
+        # Convert once, the same strings go to the judge and the report
+        expected = str(expected_response)
+        actual = str(actual_response)
 
         # Use LLM Judge for evaluation
         criteria = JudgeCriteria(**fixture.get("judge_criteria", {}))
         judge_result = self.judge.evaluate(
             question=question_text,
-            expected=str(expected_response),
-            actual=str(actual_response),
+            expected=expected,
+            actual=actual,
             criteria=criteria,
             test_type="sql_aggregate",
         )
@@ -127,17 +121,11 @@ class TestEvalAggregate:
         result = {
             "test_name": fixture_name,
             "question": question_text,
-            "expected": str(expected_response),
-            "actual": str(actual_response),
+            "expected": expected,
+            "actual": actual,
             "passed": judge_result.passed,
             "execution_time_ms": execution_time_ms,
-            "overall_score": (
-                judge_result.scores.accuracy
-                + judge_result.scores.relevance
-                + judge_result.scores.completeness
-                + judge_result.scores.hallucination
-            )
-            / 4,
+            "overall_score": judge_result.scores.average_score,
             "accuracy": judge_result.scores.accuracy,
             "relevance": judge_result.scores.relevance,
             "completeness": judge_result.scores.completeness,
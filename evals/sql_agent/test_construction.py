@@ -4,33 +4,27 @@ from pathlib import Path
 
 import pytest
 
-from evals.llm_judge import JudgeCriteria, LLMJudge
+from evals.llm_judge import JudgeCriteria, get_shared_judge
 from evals.utils import (
     get_model_info_for_test,
-    load_database_schema,
     load_yaml_fixtures,
     normalize_sql,
     save_test_report,
 )
-from src.agent.adapters.llm import LLM
 from src.agent.domain import commands, sql_model
 
 current_path = Path(__file__).parent
 # Load fixtures from YAML file
 fixtures = load_yaml_fixtures(current_path, "construction")
-schema = load_database_schema(current_path, "schema/schema.json")
 
 
 class TestEvalConstruction:
     """SQL Construction evaluation tests."""
 
-    def setup_method(self):
-        """Initialize LLM Judge for evaluation."""
-        self.judge = LLMJudge()
-
     def setup_class(self):
-        """Setup report file."""
+        """Setup report file and the shared LLM Judge."""
         self.results = []
+        self.judge = get_shared_judge()
 
     def teardown_class(self):
         """Save results to report file."""
@@ -44,7 +38,9 @@ class TestEvalConstruction:
             for fixture_name, fixture in fixtures.items()
         ],
     )
-    def test_eval_construction(self, fixture_name, fixture, agent_config, llm_config):
+    def test_eval_construction(
+        self, fixture_name, fixture, agent_config, llm, db_schema
+    ):
         """Run SQL construction test with optional LLM judge evaluation."""
 
         # Extract test data - fixture is now the test data directly
@@ -61,7 +57,6 @@ class TestEvalConstruction:
         q_id = f"test_construction_{str(uuid.uuid4())}"
         sql_question = commands.SQLQuestion(question=question_text, q_id=q_id)
 
-        llm = LLM(llm_config)
         agent = sql_model.SQLBaseAgent(
             question=sql_question,
             kwargs=agent_config,
@@ -79,7 +74,7 @@ class TestEvalConstruction:
         )
 
         # Set up the construction state with all necessary components
-        agent.construction.schema_info = schema
+        agent.construction.schema_info = db_schema
         agent.construction.column_mapping = [
             commands.ColumnMapping(**cm) for cm in column_mapping
         ]
@@ -113,17 +108,16 @@ class TestEvalConstruction:
         # Calculate execution time
         execution_time_ms = int((time.time() - start_time) * 1000)
 
-        # Add delay to avoid rate limiting
-        time.sleep(1)
-
-        # Normalize SQL for comparison
+        # Normalize SQL once, the same strings go to the judge and the report
+        expected = normalize_sql(expected_sql)
+        actual = normalize_sql(actual_sql) if actual_sql else "NO SQL GENERATED"
 
         # Use LLM Judge for evaluation
         criteria = JudgeCriteria(**fixture.get("judge_criteria", {}))
         judge_result = self.judge.evaluate(
             question=question_text,
-            expected=normalize_sql(expected_sql),
-            actual=normalize_sql(actual_sql) if actual_sql else "NO SQL GENERATED",
+            expected=expected,
+            actual=actual,
             criteria=criteria,
             test_type="sql_construction",
         )
@@ -132,17 +126,11 @@ class TestEvalConstruction:
         result = {
             "test_name": fixture_name,
             "question": question_text,
-            "expected": normalize_sql(expected_sql),
-            "actual": normalize_sql(actual_sql) if actual_sql else "NO SQL GENERATED",
+            "expected": expected,
+            "actual": actual,
             "passed": judge_result.passed,
             "execution_time_ms": execution_time_ms,
-            "overall_score": (
-                judge_result.scores.accuracy
-                + judge_result.scores.relevance
-                + judge_result.scores.completeness
-                + judge_result.scores.hallucination
-            )
-            / 4,
+            "overall_score": judge_result.scores.average_score,
             "accuracy": judge_result.scores.accuracy,
             "relevance": judge_result.scores.relevance,
             "completeness": judge_result.scores.completeness,
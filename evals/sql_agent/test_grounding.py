@@ -4,32 +4,26 @@ from pathlib import Path
 
 import pytest
 
-from evals.llm_judge import JudgeCriteria, LLMJudge
+from evals.llm_judge import JudgeCriteria, get_shared_judge
 from evals.utils import (
     get_model_info_for_test,
-    load_database_schema,
     load_yaml_fixtures,
     save_test_report,
 )
-from src.agent.adapters.llm import LLM
 from src.agent.domain import commands, sql_model
 
 current_path = Path(__file__).parent
 # Load fixtures from YAML file
 fixtures = load_yaml_fixtures(current_path, "grounding")
-schema = load_database_schema(current_path, "schema/schema.json")
 
 
 class TestEvalGrounding:
     """SQL Grounding evaluation tests."""
 
-    def setup_method(self):
-        """Initialize LLM Judge for evaluation."""
-        self.judge = LLMJudge()
-
     def setup_class(self):
-        """Setup report file."""
+        """Setup report file and the shared LLM Judge."""
         self.results = []
+        self.judge = get_shared_judge()
 
     def teardown_class(self):
         """Save results to report file."""
@@ -43,7 +37,7 @@ class TestEvalGrounding:
             for fixture_name, fixture in fixtures.items()
         ],
     )
-    def test_eval_grounding(self, fixture_name, fixture, agent_config, llm_config):
+    def test_eval_grounding(self, fixture_name, fixture, agent_config, llm, db_schema):
         """Run SQL grounding test with optional LLM judge evaluation."""
 
         # Extract test data - fixture is now the test data directly
@@ -53,7 +47,6 @@ class TestEvalGrounding:
         q_id = f"test_grounding_{str(uuid.uuid4())}"
         sql_question = commands.SQLQuestion(question=question_text, q_id=q_id)
 
-        llm = LLM(llm_config)
         agent = sql_model.SQLBaseAgent(
             question=sql_question,
             kwargs=agent_config,
@@ -68,7 +61,7 @@ class TestEvalGrounding:
         )
 
         # Set up the construction state with schema
-        agent.construction.schema_info = schema
+        agent.construction.schema_info = db_schema
 
         # Start timing
         start_time = time.time()
@@ -82,41 +75,24 @@ class TestEvalGrounding:
         )
 
         # Extract actual table and column mappings
-        actual_response = {"table_mapping": [], "column_mapping": []}
-
-        if response.table_mapping:
-            for table_map in response.table_mapping:
-                actual_response["table_mapping"].append(
-                    {
-                        "question_term": table_map.question_term,
-                        "table_name": table_map.table_name,
-                        "confidence": table_map.confidence,
-                    }
-                )
-
-        if response.column_mapping:
-            for col_map in response.column_mapping:
-                actual_response["column_mapping"].append(
-                    {
-                        "question_term": col_map.question_term,
-                        "table_name": col_map.table_name,
-                        "column_name": col_map.column_name,
-                        "confidence": col_map.confidence,
-                    }
-                )
+        actual_response = {
+            "table_mapping": [m.model_dump() for m in response.table_mapping or []],
+            "column_mapping": [m.model_dump() for m in response.column_mapping or []],
+        }
 
         # Calculate execution time
         execution_time_ms = int((time.time() - start_time) * 1000)
 
-        # Add delay to avoid rate limiting
-        time.sleep(1)
+        # Convert once, the same strings go to the judge and the report
+        expected = str(expected_response)
+        actual = str(actual_response)
 
         # Use LLM Judge for evaluation
         criteria = JudgeCriteria(**fixture.get("judge_criteria", {}))
         judge_result = self.judge.evaluate(
             question=question_text,
-            expected=str(expected_response),
-            actual=str(actual_response),
+            expected=expected,
+            actual=actual,
             criteria=criteria,
             test_type="sql_grounding",
         )
@@ -125,17 +101,11 @@ class TestEvalGrounding:
         result = {
             "test_name": fixture_name,
             "question": question_text,
-            "expected": str(expected_response),
-            "actual": str(actual_response),
+            "expected": expected,
+            "actual": actual,
             "passed": judge_result.passed,
             "execution_time_ms": execution_time_ms,
-            "overall_score": (
-                judge_result.scores.accuracy
-                + judge_result.scores.relevance
-                + judge_result.scores.completeness
-                + judge_result.scores.hallucination
-            )
-            / 4,
+            "overall_score": judge_result.scores.average_score,
             "accuracy": judge_result.scores.accuracy,
             "relevance": judge_result.scores.relevance,
             "completeness": judge_result.scores.completeness,
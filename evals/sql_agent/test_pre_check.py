@@ -4,8 +4,8 @@ from pathlib import Path
 
 import pytest
 
+from evals.rate_limit import get_agent_rate_limiter
 from evals.utils import get_model_info_for_test, load_yaml_fixtures, save_test_report
-from src.agent.adapters.llm import LLM
 from src.agent.domain import commands, sql_model
 
 current_path = Path(__file__).parent
@@ -32,19 +32,21 @@ class TestEvalPreCheck:
             for fixture_name, fixture in fixtures.items()
         ],
     )
-    def test_eval(self, fixture_name, fixture, agent_config, llm_config):
+    def test_eval(self, fixture_name, fixture, agent_config, llm):
         question_text = fixture["question"]
         expected_response = fixture["approved"]
 
         q_id = "eval_pre_check_" + str(uuid.uuid4())
         question = commands.SQLQuestion(question=question_text, q_id=q_id)
 
-        llm = LLM(llm_config)
         agent = sql_model.SQLBaseAgent(
             question=question,
             kwargs=agent_config,
         )
 
+        # Wait for rate limit budget before calling the LLM
+        get_agent_rate_limiter().acquire()
+
         start_time = time.time()
 
         # Prepare guardrails check
@@ -56,8 +58,6 @@ class TestEvalPreCheck:
         # Calculate execution time
         execution_time_ms = int((time.time() - start_time) * 1000)
 
-        # Add delay to avoid rate limiting
-        time.sleep(1)
         # Extract response
         actual_response = response.approved
 
@@ -5,7 +5,7 @@ from pathlib import Path
 
 import pytest
 
-from evals.llm_judge import JudgeCriteria, LLMJudge
+from evals.llm_judge import JudgeCriteria, get_shared_judge
 from evals.utils import (
     get_model_info_for_test,
     load_yaml_fixtures,
@@ -23,13 +23,10 @@ fixtures = load_yaml_fixtures(current_path, "e2e")
 class TestSQLEndToEnd:
     """SQL End-to-End evaluation tests using FastAPI endpoint."""
 
-    def setup_method(self):
-        """Initialize LLM Judge for evaluation."""
-        self.judge = LLMJudge()
-
     def setup_class(self):
-        """Setup report file."""
+        """Setup report file and the shared LLM Judge."""
         self.results = []
+        self.judge = get_shared_judge()
 
     def teardown_class(self):
         """Save results to report file."""
@@ -46,7 +43,7 @@ class TestSQLEndToEnd:
             if isinstance(event, events.Evaluation):
                 summary = event.summary
 
-                return summary.split("\n\nHere is the SQL query:\n\n")[-1]
+                return summary.rpartition("\n\nHere is the SQL query:\n\n")[2]
 
         return ""
 
@@ -85,24 +82,7 @@ class TestSQLEndToEnd:
         assert response.json()["status"] == "processing"
 
         # Wait for async processing to complete
-        # You may need to adjust this based on typical processing time
-        max_wait_time = 30  # Maximum wait time in seconds
-        wait_interval = 1  # Check interval in seconds
-        elapsed_time = 0
-
-        while elapsed_time < max_wait_time:
-            # Check if we have received a response event
-            session_events = test_notifications.sent.get(session_id, [])
-            has_response = any(
-                isinstance(event, events.Response) or hasattr(event, "response")
-                for event in session_events
-            )
-
-            if has_response:
-                break
-
-            time.sleep(wait_interval)
-            elapsed_time += wait_interval
+        test_notifications.wait_for_response(session_id, timeout=30)
 
         # Extract SQL from SSE response
         actual_sql = self.extract_final_response(session_id, test_notifications)
@@ -110,36 +90,29 @@ class TestSQLEndToEnd:
         # Calculate execution time
         execution_time_ms = int((time.time() - start_time) * 1000)
 
-        # Normalize SQL for comparison (basic normalization)
+        # Normalize SQL once, the same strings go to the judge and the report
+        expected = normalize_sql(expected_sql)
+        actual = normalize_sql(actual_sql) if actual_sql else "NO SQL GENERATED"
 
         # Use LLM Judge for evaluation
         criteria = JudgeCriteria(**fixture.get("judge_criteria", {}))
         judge_result = self.judge.evaluate(
             question=question,
-            expected=normalize_sql(expected_sql),
-            actual=normalize_sql(actual_sql) if actual_sql else "NO SQL GENERATED",
+            expected=expected,
+            actual=actual,
             criteria=criteria,
             test_type="sql_e2e",
         )
 
-        # Add delay to avoid rate limiting
-        time.sleep(1)
-
         # Record result
         result = {
             "test_name": fixture_name,
             "question": question,
-            "expected": normalize_sql(expected_sql),
-            "actual": normalize_sql(actual_sql) if actual_sql else "NO SQL GENERATED",
+            "expected": expected,
+            "actual": actual,
             "passed": judge_result.passed,
             "execution_time_ms": execution_time_ms,
-            "overall_score": (
-                judge_result.scores.accuracy
-                + judge_result.scores.relevance
-                + judge_result.scores.completeness
-                + judge_result.scores.hallucination
-            )
-            / 4,
+            "overall_score": judge_result.scores.average_score,
             "accuracy": judge_result.scores.accuracy,
             "relevance": judge_result.scores.relevance,
             "completeness": judge_result.scores.completeness,
@@ -3,7 +3,8 @@ from pathlib import Path
 
 import pytest
 
-from evals.llm_judge import JudgeCriteria, LLMJudge
+from evals.llm_judge import JudgeCriteria, get_shared_judge
+from evals.rate_limit import AGENT_RUN_TOKENS, get_agent_rate_limiter
 from evals.utils import get_model_info_for_test, load_yaml_fixtures, save_test_report
 from src.agent.domain import events
 
@@ -15,13 +16,10 @@ fixtures = load_yaml_fixtures(current_path, "e2e")
 class TestEvalE2E:
     """End-to-End evaluation tests."""
 
-    def setup_method(self):
-        """Initialize LLM Judge for evaluation."""
-        self.judge = LLMJudge()
-
     def setup_class(self):
-        """Setup report file."""
+        """Setup report file and the shared LLM Judge."""
         self.results = []
+        self.judge = get_shared_judge()
 
     def teardown_class(self):
         """Save results to report file."""
@@ -60,6 +58,9 @@ class TestEvalE2E:
         expected_response = fixture["response"]
         session_id = f"test-{fixture_name}"
 
+        # Wait for rate limit budget, an agent run makes several LLM calls
+        get_agent_rate_limiter().acquire(AGENT_RUN_TOKENS)
+
         # Start timing
         start_time = time.time()
 
@@ -73,24 +74,7 @@ class TestEvalE2E:
         assert response.json()["status"] == "processing"
 
         # Wait for async processing to complete
-        # You may need to adjust this based on typical processing time
-        max_wait_time = 30  # Maximum wait time in seconds
-        wait_interval = 1  # Check interval in seconds
-        elapsed_time = 0
-
-        while elapsed_time < max_wait_time:
-            # Check if we have received a response event
-            session_events = test_notifications.sent.get(session_id, [])
-            has_response = any(
-                isinstance(event, events.Response) or hasattr(event, "response")
-                for event in session_events
-            )
-
-            if has_response:
-                break
-
-            time.sleep(wait_interval)
-            elapsed_time += wait_interval
+        test_notifications.wait_for_response(session_id, timeout=30)
 
         # Extract actual response from collected notifications
         actual_response = self.extract_final_response(session_id, test_notifications)
@@ -98,37 +82,29 @@ class TestEvalE2E:
         # Calculate execution time
         execution_time_ms = int((time.time() - start_time) * 1000)
 
-        # Add delay to avoid rate limiting (E2E makes many API calls internally)
-        time.sleep(55)  # Reduced since we already waited 5 seconds
+        # Convert once, the same strings go to the judge and the report
+        expected = str(expected_response)
+        actual = str(actual_response)
 
         # Use LLM Judge for evaluation
         criteria = JudgeCriteria(**fixture.get("judge_criteria", {}))
         judge_result = self.judge.evaluate(
             question=question,
-            expected=str(expected_response),
-            actual=str(actual_response),
+            expected=expected,
+            actual=actual,
             criteria=criteria,
             test_type="e2e",
         )
 
-        # Add delay to avoid rate limiting
-        time.sleep(1)
-
         # Record result
         result = {
             "test_name": fixture_name,
             "question": question,
-            "expected": str(expected_response),
-            "actual": str(actual_response),
+            "expected": expected,
+            "actual": actual,
             "passed": judge_result.passed,
             "execution_time_ms": execution_time_ms,
-            "overall_score": (
-                judge_result.scores.accuracy
-                + judge_result.scores.relevance
-                + judge_result.scores.completeness
-                + judge_result.scores.hallucination
-            )
-            / 4,
+            "overall_score": judge_result.scores.average_score,
             "accuracy": judge_result.scores.accuracy,
             "relevance": judge_result.scores.relevance,
             "completeness": judge_result.scores.completeness,
@@ -4,10 +4,8 @@ from pathlib import Path
 
 import pytest
 
-from evals.llm_judge import JudgeCriteria, LLMJudge
+from evals.llm_judge import JudgeCriteria, get_shared_judge
 from evals.utils import get_model_info_for_test, load_yaml_fixtures, save_test_report
-from src.agent.adapters.llm import LLM
-from src.agent.config import get_agent_config, get_llm_config
 from src.agent.domain import commands, model
 
 current_path = Path(__file__).parent
@@ -18,13 +16,10 @@ fixtures = load_yaml_fixtures(current_path, "enhance")
 class TestEvalEnhance:
     """Enhancement evaluation tests."""
 
-    def setup_method(self):
-        """Initialize LLM Judge for evaluation."""
-        self.judge = LLMJudge()
-
     def setup_class(self):
-        """Setup report file."""
+        """Setup report file and the shared LLM Judge."""
         self.results = []
+        self.judge = get_shared_judge()
 
     def teardown_class(self):
         """Save results to report file."""
@@ -38,7 +33,7 @@ class TestEvalEnhance:
             for fixture_name, fixture in fixtures.items()
         ],
     )
-    def test_eval_enhance(self, fixture_name, fixture):
+    def test_eval_enhance(self, fixture_name, fixture, agent_config, llm):
         """Run enhancement test with optional LLM judge evaluation."""
 
         # Extract test data - fixture is now the test data directly
@@ -49,23 +44,22 @@ class TestEvalEnhance:
         q_id = str(uuid.uuid4())
         question = commands.Question(question=question_text, q_id=q_id)
 
-        llm = LLM(get_llm_config())
         agent = model.BaseAgent(
             question=question,
-            kwargs=get_agent_config(),
+            kwargs=agent_config,
         )
 
         # Convert candidates to KBResponse objects
-        kb_candidates = []
-        for candidate in candidates:
-            kb_candidate = commands.KBResponse(
+        kb_candidates = [
+            commands.KBResponse(
                 description=candidate.get("text", ""),
                 score=candidate.get("score", 0.0),
                 id=candidate.get("id", ""),
                 tag=candidate.get("tag", ""),
                 name=candidate.get("name", ""),
             )
-            kb_candidates.append(kb_candidate)
+            for candidate in candidates
+        ]
 
         # Create Rerank command
         rerank_command = commands.Rerank(
@@ -89,15 +83,16 @@ class TestEvalEnhance:
         # Calculate execution time
         execution_time_ms = int((time.time() - start_time) * 1000)
 
-        # Add delay to avoid rate limiting
-        time.sleep(1)
+        # Convert once, the same strings go to the judge and the report
+        expected = str(expected_response)
+        actual = str(actual_response)
 
         # Use LLM Judge for evaluation
         criteria = JudgeCriteria(**fixture.get("judge_criteria", {}))
         judge_result = self.judge.evaluate(
             question=question_text,
-            expected=str(expected_response),
-            actual=str(actual_response),
+            expected=expected,
+            actual=actual,
             criteria=criteria,
             test_type="enhance",
         )
@@ -106,17 +101,11 @@ class TestEvalEnhance:
         result = {
             "test_name": fixture_name,
             "question": question_text,
-            "expected": str(expected_response),
-            "actual": str(actual_response),
+            "expected": expected,
+            "actual": actual,
             "passed": judge_result.passed,
             "execution_time_ms": execution_time_ms,
-            "overall_score": (
-                judge_result.scores.accuracy
-                + judge_result.scores.relevance
-                + judge_result.scores.completeness
-                + judge_result.scores.hallucination
-            )
-            / 4,
+            "overall_score": judge_result.scores.average_score,
             "accuracy": judge_result.scores.accuracy,
             "relevance": judge_result.scores.relevance,
             "completeness": judge_result.scores.completeness,
@@ -4,9 +4,8 @@ from pathlib import Path
 
 import pytest
 
+from evals.rate_limit import get_agent_rate_limiter
 from evals.utils import get_model_info_for_test, load_yaml_fixtures, save_test_report
-from src.agent.adapters.llm import LLM
-from src.agent.config import get_agent_config, get_llm_config
 from src.agent.domain import commands, model
 
 current_path = Path(__file__).parent
@@ -33,7 +32,7 @@ class TestEvalPostCheck:
             for fixture_name, fixture in fixtures.items()
         ],
     )
-    def test_eval_guardrails(self, fixture_name, fixture):
+    def test_eval_guardrails(self, fixture_name, fixture, agent_config, llm):
         """Run post-check guardrails test with optional LLM judge evaluation."""
 
         # Extract test data - fixture is now the test data directly
@@ -45,10 +44,9 @@ class TestEvalPostCheck:
         q_id = str(uuid.uuid4())
         question = commands.Question(question=question_text, q_id=q_id)
 
-        llm = LLM(get_llm_config())
         agent = model.BaseAgent(
             question=question,
-            kwargs=get_agent_config(),
+            kwargs=agent_config,
         )
 
         # Create LLMResponse command for post-check
@@ -58,6 +56,9 @@ class TestEvalPostCheck:
             response=response_text,
         )
 
+        # Wait for rate limit budget before calling the LLM
+        get_agent_rate_limiter().acquire()
+
         # Start timing
         start_time = time.time()
 
@@ -68,9 +69,6 @@ class TestEvalPostCheck:
         # Calculate execution time
         execution_time_ms = int((time.time() - start_time) * 1000)
 
-        # Add delay to avoid rate limiting
-        time.sleep(1)
-
         # Extract response
         actual_response = response.approved
 
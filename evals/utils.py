@@ -1,25 +1,64 @@
 """Minimal utilities for evaluation tests."""
 
+import gzip
+import hashlib
 import json
 import os
+import threading
 import time
 from collections import defaultdict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import yaml
 
-from src.agent.adapters.database import BaseDatabaseAdapter
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# libyaml's C loader is several times faster than the pure Python SafeLoader
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 from src.agent.adapters.notifications import AbstractNotifications
 from src.agent.domain import commands, events
 
+# SQLAlchemy and pandas are only needed when results go to the database
+if TYPE_CHECKING:
+    from src.agent.adapters.database import BaseDatabaseAdapter
+
 
 class CollectingNotifications(AbstractNotifications):
     def __init__(self):
         self.sent = defaultdict(list)
+        self._condition = threading.Condition()
 
     def send(self, destination, event: events.Event):
-        self.sent[destination].append(event)
+        with self._condition:
+            self.sent[destination].append(event)
+            self._condition.notify_all()
+
+    def wait_for_response(self, destination: str, timeout: float = 30.0) -> bool:
+        """
+        Block until a response event was sent to destination.
+
+        Wakes up as soon as the event arrives instead of polling.
+
+        Returns:
+            bool: True if a response arrived before the timeout.
+        """
+
+        def has_response() -> bool:
+            return any(
+                isinstance(event, events.Response) or hasattr(event, "response")
+                for event in self.sent.get(destination, [])
+            )
+
+        with self._condition:
+            return self._condition.wait_for(has_response, timeout=timeout)
 
 
 def normalize_sql(sql: str) -> str:
@@ -28,6 +67,61 @@ def normalize_sql(sql: str) -> str:
     return " ".join(sql.split()).strip().rstrip(";")
 
 
+def get_fixture_cache_dir() -> Path:
+    """Get the parsed fixture cache directory from environment variable or use default."""
+    cache_dir = os.environ.get("EVALS_FIXTURE_CACHE_DIR")
+    if cache_dir:
+        return Path(cache_dir)
+
+    # Default: evals/.fixture_cache relative to this file
+    return Path(__file__).parent / ".fixture_cache"
+
+
+def load_yaml_file(yaml_file: Path) -> Any:
+    """
+    Load a YAML file, reusing a JSON copy of the parsed data while it is fresh.
+
+    Parsing JSON is much faster than YAML, so repeated test collections
+    only parse a fixture file again after it has changed. The copy is keyed
+    on the file's mtime in nanoseconds and its size. Files whose data does
+    not survive a JSON round trip unchanged, like YAML dates or non-string
+    keys, are always parsed from YAML.
+    """
+    cache_dir = get_fixture_cache_dir()
+    key = hashlib.sha256(str(yaml_file.resolve()).encode()).hexdigest()
+    cache_file = cache_dir / f"{key}.json"
+
+    stat = yaml_file.stat()
+    stamp = [stat.st_mtime_ns, stat.st_size]
+
+    try:
+        cached = load_json(cache_file.read_bytes())
+        if cached["stamp"] == stamp:
+            return cached["data"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    data = yaml.load(yaml_file.read_bytes(), Loader=YamlLoader)
+
+    # Only cache data that reads back unchanged: JSON turns dates into
+    # strings, and orjson rejects non-string keys
+    try:
+        payload = dump_json({"stamp": stamp, "data": data})
+    except TypeError:
+        return data
+
+    if load_json(payload)["data"] != data:
+        return data
+
+    try:
+        cache_dir.mkdir(exist_ok=True, parents=True)
+        cache_file.write_bytes(payload)
+    except OSError:
+        pass
+
+    return data
+
+
 def load_yaml_fixtures(
     test_dir: Path, subdirectory: str, recursive: bool = True
 ) -> Dict[str, Any]:
@@ -56,8 +150,7 @@ def load_yaml_fixtures(
     schema_file = None  # Track schema file for this fixture set
 
     for yaml_file in yaml_files:
-        with open(yaml_file, "r") as f:
-            suite_data = yaml.safe_load(f)
+        suite_data = load_yaml_file(yaml_file)
 
         # Extract schema file if specified
         if "schema_file" in suite_data and schema_file is None:
@@ -78,15 +171,13 @@ def load_yaml_fixtures(
             test_name = test_name.strip("_")
 
             # Merge suite defaults with test-specific criteria
-            test_data = test.copy()
-            if "default_judge_criteria" in suite_data:
-                test_data["judge_criteria"] = suite_data[
-                    "default_judge_criteria"
-                ].copy()
-                if "judge_criteria" in test:
-                    test_data["judge_criteria"].update(test["judge_criteria"])
-            elif "judge_criteria" not in test:
-                test_data["judge_criteria"] = {}
+            test_data = {
+                **test,
+                "judge_criteria": {
+                    **suite_data.get("default_judge_criteria", {}),
+                    **test.get("judge_criteria", {}),
+                },
+            }
 
             # Add schema file reference if available
             if schema_file:
@@ -115,9 +206,25 @@ def get_model_info_for_test(test_type: str) -> Dict[str, str]:
     return model_info
 
 
+def load_json(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
+def dump_json(data: Any) -> bytes:
+    """Serialize to indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2) + b"\n"
+
+    return (json.dumps(data, indent=2) + "\n").encode()
+
+
 def load_database_schema(
     test_dir: Path, schema_file: str = "schema.json"
-) -> Dict[str, Any]:
+) -> commands.DatabaseSchema:
     """
     Load database schema from JSON file.
 
@@ -126,17 +233,14 @@ def load_database_schema(
         schema_file: Name of the schema file (default: schema.json)
 
     Returns:
-        Dict containing the database schema
+        DatabaseSchema validated directly from the file bytes
     """
     schema_path = test_dir / schema_file
 
     if not schema_path.exists():
         raise FileNotFoundError(f"Schema file not found: {schema_file}")
 
-    with open(schema_path, "r") as f:
-        schema = json.load(f)
-
-    return commands.DatabaseSchema(**schema)
+    return commands.DatabaseSchema.model_validate_json(schema_path.read_bytes())
 
 
 def get_report_dir() -> Path:
@@ -150,6 +254,15 @@ def get_report_dir() -> Path:
     return Path(__file__).parent / "reports"
 
 
+def read_report(path: Path) -> Dict[str, Any]:
+    """Read a report written by save_test_report, compressed or not."""
+    path = Path(path)
+    opener = gzip.open if path.suffix == ".gz" else open
+
+    with opener(path, "rb") as f:
+        return load_json(f.read())
+
+
 def save_test_report(
     results: List[Dict[str, Any]],
     test_name: str,
@@ -175,8 +288,18 @@ def save_test_report(
     timestamp = int(time.time())
     # Create run_id from test_name and timestamp (same as filename without .json)
     run_id = f"{test_name}_report_{timestamp}"
+
+    # Under pytest-xdist every worker reports the part of the suite it ran
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker:
+        run_id = f"{run_id}_{worker}"
     filename = f"{run_id}.json"
 
+    # Reports compress well; EVALS_REPORT_FORMAT=json.gz writes gzipped files
+    compress = os.environ.get("EVALS_REPORT_FORMAT", "json") == "json.gz"
+    if compress:
+        filename += ".gz"
+
     # Create report with metadata
     report = {
         "run_id": run_id,
@@ -186,8 +309,12 @@ def save_test_report(
         "results": results,
     }
 
-    with open(report_dir / filename, "w") as f:
-        json.dump(report, f, indent=2)
+    if compress:
+        with gzip.open(report_dir / filename, "wb", compresslevel=1) as f:
+            f.write(dump_json(report))
+    else:
+        with open(report_dir / filename, "wb") as f:
+            f.write(dump_json(report))
 
     print(f"Report saved to: {report_dir / filename}")
 
@@ -199,6 +326,34 @@ def save_test_report(
             print(f"Failed to save to database: {e}")
 
 
+# One connected adapter (and engine pool) per connection string for the whole session
+_databases: Dict[str, "BaseDatabaseAdapter"] = {}
+
+
+def get_evaluation_database(
+    connection_string: str,
+) -> Optional["BaseDatabaseAdapter"]:
+    """Return the shared evaluation database adapter, connecting on first use."""
+    from src.agent.adapters.database import BaseDatabaseAdapter
+
+    db = _databases.get(connection_string)
+    if db is None:
+        db = BaseDatabaseAdapter({"connection_string": connection_string})
+        db.connect()
+        if db.engine is None:
+            return None
+        _databases[connection_string] = db
+
+    return db
+
+
+def close_evaluation_databases() -> None:
+    """Dispose all shared evaluation database engines."""
+    while _databases:
+        _, db = _databases.popitem()
+        db.disconnect()
+
+
 def save_to_database(
     results: List[Dict[str, Any]],
     test_suite: str,
@@ -214,60 +369,57 @@ def save_to_database(
     if not connection_string:
         return None
 
-    db = BaseDatabaseAdapter({"connection_string": connection_string})
-
-    try:
-        db.connect()
-
-        # Create test run record
-        run_data = {
-            "run_id": run_id,
-            "test_suite": test_suite,
-            "total_tests": len(results),
-            "passed_tests": sum(1 for r in results if r.get("passed", False)),
-            "failed_tests": sum(1 for r in results if not r.get("passed", False)),
-        }
+    db = get_evaluation_database(connection_string)
+    if db is None:
+        print("Failed to connect to evaluation database")
+        return None
 
-        # Add model info fields if available
-        if model_info:
-            run_data["model_id"] = model_info.get("model_id")
-            run_data["model_api_base"] = model_info.get("model_api_base")
-            run_data["model_temperature"] = model_info.get("temperature")
+    # Create test run record
+    run_data = {
+        "run_id": run_id,
+        "test_suite": test_suite,
+        "total_tests": len(results),
+        "passed_tests": sum(1 for r in results if r.get("passed", False)),
+        "failed_tests": sum(1 for r in results if not r.get("passed", False)),
+    }
 
-        if not db.insert_data("test_runs", run_data):
-            print("Failed to insert test run")
-            return None
+    # Add model info fields if available
+    if model_info:
+        run_data["model_id"] = model_info.get("model_id")
+        run_data["model_api_base"] = model_info.get("model_api_base")
+        run_data["model_temperature"] = model_info.get("temperature")
 
-        # Prepare all test results for batch insert
-        test_results = []
-        for result in results:
-            test_data = {
-                "run_id": run_id,
-                "test_name": result.get("test_name") or result.get("test", ""),
-                "question": result.get("question", ""),
-                "expected": str(result.get("expected", "")),
-                "actual": str(result.get("actual", "")),
-                "passed": result.get("passed", False),
-                "execution_time_ms": result.get("execution_time_ms"),
-                "overall_score": result.get("overall_score"),
-                "accuracy_score": result.get("accuracy"),
-                "relevance_score": result.get("relevance"),
-                "completeness_score": result.get("completeness"),
-                "hallucination_score": result.get("hallucination"),
-                "judge_assessment": result.get("judge_assessment"),
-            }
+    if not db.insert_data("test_runs", run_data):
+        print("Failed to insert test run")
+        return None
 
-            # Remove None values
-            test_data = {k: v for k, v in test_data.items() if v is not None}
-            test_results.append(test_data)
+    # Prepare all test results for batch insert
+    test_results = []
+    for result in results:
+        test_data = {
+            "run_id": run_id,
+            "test_name": result.get("test_name") or result.get("test", ""),
+            "question": result.get("question", ""),
+            "expected": str(result.get("expected", "")),
+            "actual": str(result.get("actual", "")),
+            "passed": result.get("passed", False),
+            "execution_time_ms": result.get("execution_time_ms"),
+            "overall_score": result.get("overall_score"),
+            "accuracy_score": result.get("accuracy"),
+            "relevance_score": result.get("relevance"),
+            "completeness_score": result.get("completeness"),
+            "hallucination_score": result.get("hallucination"),
+            "judge_assessment": result.get("judge_assessment"),
+        }
 
-        # Insert all test results in a single transaction
-        if not db.insert_batch("test_results", test_results):
-            print("Failed to insert test results")
-            return None
+        # Remove None values
+        test_data = {k: v for k, v in test_data.items() if v is not None}
+        test_results.append(test_data)
 
-        print(f"Results saved to database with run_id: {run_id}")
-        return run_id
+    # Insert all test results in a single transaction
+    if not db.insert_batch("test_results", test_results):
+        print("Failed to insert test results")
+        return None
 
-    finally:
-        db.disconnect()
+    print(f"Results saved to database with run_id: {run_id}")
+    return run_id
@@ -96,6 +96,39 @@ def migrate_metadata_columns(engine):
                 logger.info(f"Renamed {table_name}.{old_col} to {new_col}")
 
 
+def migrate_json_columns(engine):
+    """Convert JSON columns from older installations to JSONB."""
+
+    columns = [
+        ("evaluation_runs", "meta_data"),
+        ("test_results", "judge_scores"),
+        ("test_results", "meta_data"),
+        ("tool_agent_results", "tool_outputs"),
+        ("sql_test_results", "schema_context"),
+    ]
+
+    with engine.begin() as conn:
+        for table_name, column in columns:
+            result = conn.execute(
+                text("""
+                SELECT data_type
+                FROM information_schema.columns
+                WHERE table_name = :table_name AND column_name = :column
+            """),
+                {"table_name": table_name, "column": column},
+            )
+
+            row = result.fetchone()
+            if row and row[0] == "json":
+                conn.execute(
+                    text(
+                        f"ALTER TABLE {table_name} ALTER COLUMN {column} "
+                        f"TYPE jsonb USING {column}::jsonb"
+                    )
+                )
+                logger.info(f"Converted {table_name}.{column} to JSONB")
+
+
 def create_evaluation_tables():
     """Create evaluation tables using SQLAlchemy."""
 
@@ -117,6 +150,7 @@ def create_evaluation_tables():
     # First, try to migrate existing columns if needed
     try:
         migrate_metadata_columns(engine)
+        migrate_json_columns(engine)
     except Exception as e:
         logger.warning(
             f"Migration check failed (this is OK for new installations): {e}"
@@ -213,6 +247,11 @@ def create_evaluation_tables():
     CREATE INDEX IF NOT EXISTS idx_evaluation_metrics_run_id ON evaluation_metrics(run_id);
     CREATE INDEX IF NOT EXISTS idx_evaluation_metrics_metric_type ON evaluation_metrics(metric_type);
 
+    -- GIN indexes for containment queries on JSONB and array columns
+    CREATE INDEX IF NOT EXISTS idx_evaluation_runs_fixtures_used ON evaluation_runs USING gin(fixtures_used);
+    CREATE INDEX IF NOT EXISTS idx_evaluation_runs_meta_data ON evaluation_runs USING gin(meta_data);
+    CREATE INDEX IF NOT EXISTS idx_test_results_judge_scores ON test_results USING gin(judge_scores);
+
     -- Create updated_at trigger function
     CREATE OR REPLACE FUNCTION update_updated_at_column()
     RETURNS TRIGGER AS $$
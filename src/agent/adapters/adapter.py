@@ -1,6 +1,6 @@
+import heapq
 from abc import ABC
 
-from langfuse import get_client, observe
 from loguru import logger
 from sqlalchemy import MetaData
 
@@ -8,6 +8,7 @@ from sqlalchemy import MetaData
 from src.agent import config
 from src.agent.adapters import agent_tools, database, llm, rag
 from src.agent.domain import commands, model
+from src.agent.observability.tracing import observe
 
 
 class AbstractAdapter(ABC):
@@ -65,7 +66,7 @@ class AbstractAdapter(ABC):
             An iterator of events.
         """
         while self.agent.events:
-            event = self.agent.events.pop(0)
+            event = self.agent.events.popleft()
             yield event
 
 
@@ -148,6 +149,17 @@ class AgentAdapter(AbstractAdapter):
             kwargs=config.get_tools_config(),
         )
 
+        self._dispatch = {
+            commands.Question: self.question,
+            commands.Check: self.check,
+            commands.Retrieve: self.retrieve,
+            commands.Rerank: self.rerank,
+            commands.Enhance: self.enhance,
+            commands.UseTools: self.use,
+            commands.LLMResponse: self.finalize,
+            commands.FinalCheck: self.evaluate,
+        }
+
     def answer(self, command: commands.Command) -> commands.Command:
         """
         Answer a command. Processes each request by the command type
@@ -158,30 +170,15 @@ class AgentAdapter(AbstractAdapter):
         Returns:
             commands.Command: The command to answer.
         """
-        match command:
-            case commands.Question():
-                response = self.question(command)
-            case commands.Check():
-                response = self.check(command)
-            case commands.Retrieve():
-                response = self.retrieve(command)
-            case commands.Rerank():
-                response = self.rerank(command)
-            case commands.Enhance():
-                response = self.enhance(command)
-            case commands.UseTools():
-                response = self.use(command)
-            case commands.LLMResponse():
-                response = self.finalize(command)
-            case commands.FinalCheck():
-                response = self.evaluate(command)
-            case _:
-                raise NotImplementedError(
-                    f"Not implemented in AgentAdapter: {type(command)}"
-                )
-        return response
+        handler = self._dispatch.get(type(command))
+
+        if handler is None:
+            raise NotImplementedError(
+                f"Not implemented in AgentAdapter: {type(command)}"
+            )
+        return handler(command)
 
-    @observe()
+    @observe(name="check")
     def check(self, command: commands.Check) -> commands.Check:
         """
         Check the incoming question via guardrails.
@@ -192,12 +189,6 @@ class AgentAdapter(AbstractAdapter):
         Returns:
             commands.Check: The command to check.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="check",
-            session_id=command.q_id,
-        )
         response = self.guardrails.use(
             command.question, commands.GuardrailPreCheckModel
         )
@@ -208,7 +199,7 @@ class AgentAdapter(AbstractAdapter):
 
         return command
 
-    @observe()
+    @observe(name="enhance")
     def enhance(self, command: commands.Enhance):
         """
         Enhance the question via LLM based on the reranked document.
@@ -219,13 +210,6 @@ class AgentAdapter(AbstractAdapter):
         Returns:
             commands.Enhance: The command to enhance the question.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="enhance",
-            session_id=command.q_id,
-        )
-
         response = self.llm.use(command.question, commands.LLMResponseModel)
 
         command.response = response.response
@@ -233,7 +217,7 @@ class AgentAdapter(AbstractAdapter):
 
         return command
 
-    @observe()
+    @observe(name="evaluation")
     def evaluate(self, command: commands.FinalCheck) -> commands.FinalCheck:
         """
         Evaluate the response via guardrails.
@@ -244,12 +228,6 @@ class AgentAdapter(AbstractAdapter):
         Returns:
             commands.FinalCheck: The command to evaluate.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="evaluation",
-            session_id=command.q_id,
-        )
         response = self.guardrails.use(
             command.question, commands.GuardrailPostCheckModel
         )
@@ -265,7 +243,7 @@ class AgentAdapter(AbstractAdapter):
 
         return command
 
-    @observe()
+    @observe(name="finalize")
     def finalize(self, command: commands.LLMResponse) -> commands.LLMResponse:
         """
         Finalize the response via LLM.
@@ -276,13 +254,6 @@ class AgentAdapter(AbstractAdapter):
         Returns:
             commands.LLMResponse: The command to finalize the response.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="finalize",
-            session_id=command.q_id,
-        )
-
         response = self.llm.use(command.question, commands.LLMResponseModel)
 
         command.response = response.response
@@ -290,10 +261,9 @@ class AgentAdapter(AbstractAdapter):
 
         return command
 
-    @observe()
     def question(self, command: commands.Question) -> commands.Question:
         """
-        Only for tracing.
+        Pass the question on unchanged. Not traced, its span would be empty.
 
         Args:
             command: commands.Question: The command to handle a question.
@@ -301,16 +271,9 @@ class AgentAdapter(AbstractAdapter):
         Returns:
             commands.Question: The command to handle a question.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="question",
-            session_id=command.q_id,
-        )
-
         return command
 
-    @observe()
+    @observe(name="rerank")
     def rerank(self, command: commands.Rerank):
         """
         Rerank the documents from the knowledge base.
@@ -323,19 +286,27 @@ class AgentAdapter(AbstractAdapter):
         """
         candidates = []
 
-        for candidate in command.candidates:
-            response = self.rag.rerank(command.question, candidate.description)
-
-            temp = candidate.model_dump()
-            temp.pop("score", None)
-            candidates.append(commands.RerankResponse(**response, **temp))
+        # Score all candidates concurrently, responses keep the candidate order
+        responses = self.rag.rerank_batch(
+            command.question,
+            [candidate.description for candidate in command.candidates],
+        )
 
-        candidates = sorted(candidates, key=lambda x: -x.score)
+        # The score comes from the response, the candidate only adds its identity
+        for candidate, response in zip(command.candidates, responses):
+            candidates.append(
+                commands.RerankResponse(
+                    **response, id=candidate.id, tag=candidate.tag, name=candidate.name
+                )
+            )
 
-        command.candidates = candidates[: self.rag.n_ranking_candidates]
+        # Only the top candidates are kept, no need to sort all of them
+        command.candidates = heapq.nlargest(
+            self.rag.n_ranking_candidates, candidates, key=lambda x: x.score
+        )
         return command
 
-    @observe()
+    @observe(name="retrieve")
     def retrieve(self, command: commands.Retrieve):
         """
         Retrieve the most relevant documents from the knowledge base.
@@ -346,12 +317,6 @@ class AgentAdapter(AbstractAdapter):
         Returns:
             commands.Retrieve: The command to retrieve the most relevant documents.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="retrieve",
-            session_id=command.q_id,
-        )
         candidates = []
         response = self.rag.embed(command.question)
 
@@ -364,7 +329,7 @@ class AgentAdapter(AbstractAdapter):
         command.candidates = candidates
         return command
 
-    @observe()
+    @observe(name="use")
     def use(self, command: commands.UseTools) -> commands.UseTools:
         """
         Use the agent tools to process the question.
@@ -375,12 +340,6 @@ class AgentAdapter(AbstractAdapter):
         Returns:
             commands.UseTools: The command to use the agent tools.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="use",
-            session_id=command.q_id,
-        )
         response, memory = self.tools.use(command.question)
 
         command.memory = memory
@@ -439,7 +398,7 @@ class SQLAgentAdapter(AbstractAdapter):
         )
         self.rag = rag.BaseRAG(config.get_rag_config())
 
-    @observe()
+    @observe(name="aggregation")
     def aggregation(self, command: commands.SQLAggregation) -> commands.SQLAggregation:
         """
         Aggregate the question to schema elements.
@@ -450,12 +409,6 @@ class SQLAgentAdapter(AbstractAdapter):
         Returns:
             commands.SQLAggregation: The command to aggregation.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="aggregation",
-            session_id=command.q_id,
-        )
         response = self.llm.use(command.question, commands.AggregationResponse)
 
         command.aggregations = response.aggregations
@@ -465,7 +418,7 @@ class SQLAgentAdapter(AbstractAdapter):
 
         return command
 
-    @observe()
+    @observe(name="check")
     def check(self, command: commands.Check) -> commands.Check:
         """
         Check the incoming question via guardrails.
@@ -476,12 +429,6 @@ class SQLAgentAdapter(AbstractAdapter):
         Returns:
             commands.Check: The command to check.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="check",
-            session_id=command.q_id,
-        )
         response = self.guardrails.use(
             command.question, commands.GuardrailPreCheckModel
         )
@@ -492,7 +439,7 @@ class SQLAgentAdapter(AbstractAdapter):
 
         return command
 
-    @observe()
+    @observe(name="construction")
     def construction(
         self, command: commands.SQLConstruction
     ) -> commands.SQLConstruction:
@@ -505,12 +452,6 @@ class SQLAgentAdapter(AbstractAdapter):
         Returns:
             commands.SQLConstruction: The command to construction.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="construction",
-            session_id=command.q_id,
-        )
         response = self.llm.use(command.question, commands.ConstructionResponse)
 
         command.sql_query = response.sql_query
@@ -565,7 +506,7 @@ class SQLAgentAdapter(AbstractAdapter):
 
         return new_schema
 
-    @observe()
+    @observe(name="validation")
     def filter(self, command: commands.SQLFilter) -> commands.SQLFilter:
         """
         Validate the question to schema elements.
@@ -576,12 +517,6 @@ class SQLAgentAdapter(AbstractAdapter):
         Returns:
             commands.SQLValidation: The command to validation.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="validation",
-            session_id=command.q_id,
-        )
         response = self.llm.use(command.question, commands.FilterResponse)
 
         command.chain_of_thought = response.chain_of_thought
@@ -589,7 +524,7 @@ class SQLAgentAdapter(AbstractAdapter):
 
         return command
 
-    @observe()
+    @observe(name="grounding")
     def grounding(self, command: commands.SQLGrounding) -> commands.SQLGrounding:
         """
         Ground the question to schema elements.
@@ -600,12 +535,6 @@ class SQLAgentAdapter(AbstractAdapter):
         Returns:
             commands.SQLGrounding: The command to ground.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="grounding",
-            session_id=command.q_id,
-        )
         response = self.llm.use(command.question, commands.GroundingResponse)
 
         command.table_mapping = response.table_mapping
@@ -614,7 +543,7 @@ class SQLAgentAdapter(AbstractAdapter):
 
         return command
 
-    @observe()
+    @observe(name="grounding")
     def join_inference(
         self, command: commands.SQLJoinInference
     ) -> commands.SQLJoinInference:
@@ -627,12 +556,6 @@ class SQLAgentAdapter(AbstractAdapter):
         Returns:
             commands.SQLJoinInference: The command to join inference.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="grounding",
-            session_id=command.q_id,
-        )
         response = self.llm.use(command.question, commands.JoinInferenceResponse)
 
         command.joins = response.joins
@@ -675,7 +598,7 @@ class SQLAgentAdapter(AbstractAdapter):
                 )
         return response
 
-    @observe()
+    @observe(name="question")
     def question(self, command: commands.Question) -> commands.Question:
         """
         Gets the schema info from the database.
@@ -686,13 +609,6 @@ class SQLAgentAdapter(AbstractAdapter):
         Returns:
             commands.Question: The command to handle a question.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="question",
-            session_id=command.q_id,
-        )
-
         with self.database as db:
             schema = db.get_schema()
 
@@ -706,18 +622,11 @@ class SQLAgentAdapter(AbstractAdapter):
 
         return command
 
-    @observe()
+    @observe(name="sql_execution")
     def sql_execution(self, command: commands.SQLExecution) -> commands.SQLExecution:
         """
         Execute the SQL query.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="sql_execution",
-            session_id=command.q_id,
-        )
-
         with self.database as db:
             data = db.execute_query(command.sql_query)
 
@@ -725,7 +634,7 @@ class SQLAgentAdapter(AbstractAdapter):
 
         return command
 
-    @observe()
+    @observe(name="validation")
     def validation(self, command: commands.SQLValidation) -> commands.SQLValidation:
         """
         Ground the question to schema elements.
@@ -736,13 +645,6 @@ class SQLAgentAdapter(AbstractAdapter):
         Returns:
             commands.SQLFilter: The command to filter.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="validation",
-            session_id=command.q_id,
-        )
-
         response = self.llm.use(command.question, commands.ValidationResponse)
 
         command.approved = response.approved
@@ -786,7 +688,7 @@ class ScenarioAdapter(AbstractAdapter):
             kwargs=config.get_llm_config(),
         )
 
-    @observe()
+    @observe(name="check")
     def check(self, command: commands.Scenario) -> commands.Scenario:
         """
         Check the incoming question via guardrails.
@@ -797,12 +699,6 @@ class ScenarioAdapter(AbstractAdapter):
         Returns:
             commands.Scenario: The command to check.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="check",
-            session_id=command.q_id,
-        )
         response = self.guardrails.use(
             command.question, commands.GuardrailPreCheckModel
         )
@@ -812,7 +708,7 @@ class ScenarioAdapter(AbstractAdapter):
 
         return command
 
-    @observe()
+    @observe(name="finalize")
     def finalize(
         self, command: commands.ScenarioLLMResponse
     ) -> commands.ScenarioLLMResponse:
@@ -826,12 +722,6 @@ class ScenarioAdapter(AbstractAdapter):
         Returns:
             commands.ScenarioLLMResponse: The command to finalize.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="finalize",
-            session_id=command.q_id,
-        )
         response = self.llm.use(command.question, commands.ScenarioResponse)
 
         command.chain_of_thought = response.chain_of_thought
@@ -911,7 +801,7 @@ class ScenarioAdapter(AbstractAdapter):
                 )
         return response
 
-    @observe()
+    @observe(name="question")
     def question(self, command: commands.Question) -> commands.Question:
         """
         Gets the schema info from the database.
@@ -922,13 +812,6 @@ class ScenarioAdapter(AbstractAdapter):
         Returns:
             commands.Question: The command to handle a question.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="question",
-            session_id=command.q_id,
-        )
-
         with self.database as db:
             schema = db.get_schema()
 
@@ -942,7 +825,7 @@ class ScenarioAdapter(AbstractAdapter):
 
         return command
 
-    @observe()
+    @observe(name="validation")
     def validation(
         self, command: commands.ScenarioFinalCheck
     ) -> commands.ScenarioFinalCheck:
@@ -955,13 +838,6 @@ class ScenarioAdapter(AbstractAdapter):
         Returns:
             commands.ScenarioFinalCheck: The command to validate.
         """
-        langfuse = get_client()
-
-        langfuse.update_current_trace(
-            name="validation",
-            session_id=command.q_id,
-        )
-
         response = self.llm.use(command.question, commands.ScenarioValidationResponse)
 
         command.approved = response.approved
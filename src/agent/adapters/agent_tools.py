@@ -1,11 +1,12 @@
+import functools
 import os
 from abc import ABC
+from copy import deepcopy
 from datetime import datetime
 from typing import Dict, List, Tuple
 
 import src.agent.adapters.tools as tools
 import yaml
-from langfuse import get_client, observe
 from opentelemetry import trace
 from smolagents import (
     ActionStep,
@@ -16,6 +17,28 @@ from smolagents import (
     TaskStep,
 )
 from src.agent.observability.context import ctx_query_id
+from src.agent.observability.tracing import get_client, observe
+
+# libyaml's C loader is several times faster than the pure Python SafeLoader
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+
+# Step type -> the step attribute that goes into the agent's memory
+MEMORY_FIELDS = {
+    TaskStep: "task",
+    ActionStep: "model_output",
+    PlanningStep: "plan",
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _load_prompts(prompt_path: str, mtime: float) -> Dict:
+    """Parse a prompt file once per modification time."""
+    with open(prompt_path, "r") as file:
+        return yaml.load(file, Loader=YamlLoader)
 
 
 class AbstractTools(ABC):
@@ -42,6 +65,7 @@ class Tools(AbstractTools):
         - use(self): Use the tools.
         - init_model(self): Initialize the llm model.
         - init_prompt_templates(self): Initialize the prompt templates for tool calls.
+        - render_system_prompt(self): Fill the current date into the system prompt.
         - init_agent(self): Initialize the agent.
         - get_memory(self): Get the agent's memory.
     """
@@ -62,6 +86,8 @@ class Tools(AbstractTools):
         self.kwargs = kwargs
         self.llm_model_id = kwargs["llm_model_id"]
         self.max_steps = int(kwargs["max_steps"])
+        # setup_tracing runs before the adapters are built, read the switch once
+        self.telemetry_enabled = os.getenv("TELEMETRY_ENABLED", None) == "true"
 
         # in this order
         self.model = self.init_model(self.kwargs)
@@ -78,13 +104,13 @@ class Tools(AbstractTools):
         memory = []
 
         for step in self.agent.memory.steps:
-            if type(step) is TaskStep:
-                memory.append(step.task)
-            elif type(step) is ActionStep:
-                if step.model_output is not None:
-                    memory.append(step.model_output)
-            elif type(step) is PlanningStep:
-                memory.append(step.plan)
+            field = MEMORY_FIELDS.get(type(step))
+
+            if field is not None:
+                value = getattr(step, field)
+
+                if value is not None:
+                    memory.append(value)
 
         return memory
 
@@ -145,16 +171,34 @@ class Tools(AbstractTools):
         """
         prompt_path = kwargs["prompt_path"]
 
-        with open(prompt_path, "r") as file:
-            base_prompts = yaml.safe_load(file)
-
-        base_prompts["system_prompt"] = base_prompts["system_prompt"].replace(
-            "{{current_date}}", datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        # The parsed file is shared, the copy keeps the date substitution local
+        base_prompts = deepcopy(
+            _load_prompts(str(prompt_path), os.stat(prompt_path).st_mtime)
         )
+
+        # Kept unrendered, so every run gets the current date
+        self.system_prompt_template = base_prompts["system_prompt"]
+        self.has_current_date = "{{current_date}}" in self.system_prompt_template
+
+        base_prompts["system_prompt"] = self.render_system_prompt()
         prompt_templates = PromptTemplates(**base_prompts)
 
         return prompt_templates
 
+    def render_system_prompt(self) -> str:
+        """
+        Fill the current date into the system prompt template.
+
+        Returns:
+            system_prompt: str: The system prompt for the next run.
+        """
+        if not self.has_current_date:
+            return self.system_prompt_template
+
+        return self.system_prompt_template.replace(
+            "{{current_date}}", datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        )
+
     def use(self, question: str) -> Tuple[str, List[str]]:
         """
         Use the agent's tools.
@@ -166,7 +210,11 @@ class Tools(AbstractTools):
             response: str: The response from the agent's tools.
             memory: List[str]: The agent's memory for each step.
         """
-        if os.getenv("TELEMETRY_ENABLED", None) == "true":
+        # The agent lives as long as the process, refresh the date in its prompt
+        if self.has_current_date:
+            self.agent.prompt_templates["system_prompt"] = self.render_system_prompt()
+
+        if self.telemetry_enabled:
             response = self._use_with_telemetry(question)
         else:
             response = self._use(question)
@@ -198,20 +246,21 @@ class Tools(AbstractTools):
         Returns:
             response: str: The response from the agent's tools.
         """
+        session_id = ctx_query_id.get()
         langfuse = get_client()
 
         langfuse.update_current_trace(
             name="use_tools",
-            session_id=ctx_query_id.get(),
+            session_id=session_id,
         )
 
         tracer = trace.get_tracer("smolagents")
 
         with tracer.start_as_current_span("Smolagent-Trace") as span:
-            span.set_attribute("session.id", ctx_query_id.get())
-            span.set_attribute("langfuse.session.id", ctx_query_id.get())
-            span.set_attribute("langfuse.session_id", ctx_query_id.get())
-            span.set_attribute("session_id", ctx_query_id.get())
+            span.set_attribute("session.id", session_id)
+            span.set_attribute("langfuse.session.id", session_id)
+            span.set_attribute("langfuse.session_id", session_id)
+            span.set_attribute("session_id", session_id)
 
             response = self.agent.run(question)
 
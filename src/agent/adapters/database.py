@@ -1,4 +1,5 @@
 from abc import ABC
+from collections import defaultdict
 from typing import Any, Dict, List, Optional
 
 import pandas as pd
@@ -172,14 +173,18 @@ class BaseDatabaseAdapter(AbstractDatabase):
             logger.warning("No data to insert.")
             return True
 
+        # Group rows by their columns, so each group is sent as one executemany
+        groups = defaultdict(list)
+        for data in data_list:
+            groups[tuple(data.keys())].append(data)
+
         try:
             with self.engine.begin() as conn:
-                for data in data_list:
-                    # Build INSERT query for each row to handle different columns
-                    columns = ", ".join([f'"{col}"' for col in data.keys()])
-                    placeholders = ", ".join([f":{key}" for key in data.keys()])
+                for keys, rows in groups.items():
+                    columns = ", ".join([f'"{col}"' for col in keys])
+                    placeholders = ", ".join([f":{key}" for key in keys])
                     query = f'INSERT INTO "{table_name}" ({columns}) VALUES ({placeholders})'
-                    conn.execute(text(query), data)
+                    conn.execute(text(query), rows)
 
             count = len(data_list)
             if count == 1:
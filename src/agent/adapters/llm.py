@@ -1,11 +1,12 @@
 from abc import ABC
+from typing import Iterator
 
 import instructor
-from langfuse import get_client, observe
 from litellm import completion
 from pydantic import BaseModel
 
 from src.agent.observability.context import ctx_query_id
+from src.agent.observability.tracing import get_client, observe
 
 
 class AbstractLLM(ABC):
@@ -41,6 +42,19 @@ class AbstractLLM(ABC):
         """
         pass
 
+    def stream(self, question: str, response_model: BaseModel) -> Iterator[BaseModel]:
+        """
+        Calls the LLM model and yields partial responses while they are generated.
+
+        Args:
+            question: str: The question to use the LLM model.
+            response_model: BaseModel: The response model.
+
+        Returns:
+            responses: Iterator[BaseModel]: Partially filled response models.
+        """
+        pass
+
 
 class LLM(AbstractLLM):
     def __init__(self, kwargs):
@@ -101,3 +115,39 @@ class LLM(AbstractLLM):
         )
 
         return response
+
+    @observe(as_type="generation")
+    def stream(self, question: str, response_model: BaseModel) -> Iterator[BaseModel]:
+        """
+        Calls the LLM model and yields partial responses while they are generated.
+
+        Fields of the partial responses are None until they have been streamed.
+        Stopping the iteration closes the underlying request.
+
+        Args:
+            question: str: The question to use the LLM model.
+            response_model: BaseModel: The response model.
+
+        Returns:
+            responses: Iterator[BaseModel]: Partially filled response models.
+        """
+        messages = [
+            {"role": "system", "content": "You are a helpful assistant."},
+            {"role": "user", "content": question},
+        ]
+
+        langfuse = get_client()
+
+        langfuse.update_current_trace(
+            name="llm_call",
+            input=messages.copy(),
+            metadata={"temperature": self.temperature, "model": self.model_id},
+            session_id=ctx_query_id.get(),
+        )
+
+        yield from self.client.chat.completions.create_partial(
+            messages=messages,
+            response_model=response_model,
+            model=self.model_id,
+            temperature=self.temperature,
+        )
@@ -1,4 +1,5 @@
 from abc import ABC
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 
 import httpx
@@ -11,6 +12,7 @@ class AbstractModel(ABC):
 
     Methods:
         - rerank(self) -> None: Rerank the text.
+        - rerank_batch(self) -> None: Rerank several texts.
         - retrieve(self) -> None: Retrieve the text.
     """
 
@@ -23,6 +25,11 @@ class AbstractModel(ABC):
     def rerank(self, question: str, text: str) -> Dict[str, str]:
         pass
 
+    def rerank_batch(
+        self, question: str, texts: List[str]
+    ) -> List[Optional[Dict[str, str]]]:
+        pass
+
     def retrieve(self, embedding: list[float]) -> Dict[str, List[str]]:
         pass
 
@@ -34,10 +41,15 @@ class BaseRAG(AbstractModel):
     Methods:
         - embed(self, text: str) -> Dict[str, List[float]]: Embed the text.
         - rerank(self, question: str, text: str) -> Dict[str, str]: Rerank the text.
+        - rerank_batch(self, question: str, texts: List[str]) -> List[Optional[Dict[str, str]]]: Rerank several texts.
         - retrieve(self, embedding: list[float]) -> Dict[str, List[str]]: Retrieve the text.
         - call_api(self, api_url, body={}, method="get") -> None: Call the API.
+        - close(self) -> None: Close the pooled HTTP client.
     """
 
+    # Number of rerank requests in flight in rerank_batch
+    rerank_workers: int = 8
+
     def __init__(self, kwargs):
         """
         Initialize the BaseRAG model.
@@ -55,6 +67,39 @@ class BaseRAG(AbstractModel):
         self.retrieval_url = kwargs["retrieval_url"]
         self.retrieval_table = kwargs["retrieval_table"]
 
+        self.client = self.init_client()
+
+    def init_client(self) -> httpx.Client:
+        """
+        Initialize one pooled HTTP client for all RAG requests.
+
+        Connections are kept alive between calls, and HTTP/2 is used if h2
+        is installed.
+
+        Returns:
+            client: httpx.Client: The HTTP client.
+        """
+        try:
+            import h2  # noqa: F401
+
+            http2 = True
+        except ImportError:
+            http2 = False
+
+        return httpx.Client(
+            http2=http2,
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=32,
+                max_keepalive_connections=32,
+                keepalive_expiry=300,
+            ),
+        )
+
+    def close(self) -> None:
+        """Close the pooled HTTP client."""
+        self.client.close()
+
     def call_api(
         self, api_url: str, body: Dict = {}, method: str = "get"
     ) -> Optional[httpx.Response]:
@@ -71,9 +116,9 @@ class BaseRAG(AbstractModel):
         """
         try:
             if method == "get":
-                response = httpx.get(api_url, params=body, timeout=30.0)
+                response = self.client.get(api_url, params=body, timeout=30.0)
             elif method == "post":
-                response = httpx.post(api_url, json=body, timeout=30.0)
+                response = self.client.post(api_url, json=body, timeout=30.0)
             else:
                 raise ValueError("Invalid method")
 
@@ -121,6 +166,30 @@ class BaseRAG(AbstractModel):
 
         return response.json() if response else None
 
+    def rerank_batch(
+        self, question: str, texts: List[str]
+    ) -> List[Optional[Dict[str, str]]]:
+        """
+        Rerank several texts against the same question.
+
+        The ranking API scores one text per request, so the requests are
+        sent concurrently instead of one after another.
+
+        Args:
+            question: str: The question to rerank the texts.
+            texts: List[str]: The texts to rerank.
+
+        Returns:
+            responses: List[Optional[Dict[str, str]]]: One response per text, in order. Failed requests are None.
+        """
+        if len(texts) <= 1:
+            return [self.rerank(question, text) for text in texts]
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.rerank_workers, len(texts))
+        ) as executor:
+            return list(executor.map(lambda text: self.rerank(question, text), texts))
+
     def retrieve(self, embedding: list[float]) -> Dict[str, List[str]]:
         """
         Retrieve the text.
@@ -1,9 +1,28 @@
+from functools import cache, wraps
 from os import getenv
 from pathlib import Path
+from types import MappingProxyType
 
 ROOTDIR: str = str(Path(__file__).resolve().parents[2])
 
 
+def cached_config(func):
+    """
+    Read a config from the environment once per process.
+
+    The result is shared between callers, so it is returned as a read-only mapping.
+    Call cache_clear() on the getter after changing the environment.
+    """
+
+    @cache
+    @wraps(func)
+    def wrapper():
+        return MappingProxyType(func())
+
+    return wrapper
+
+
+@cached_config
 def get_agent_config():
     prompts_file = getenv("agent_prompts_file")
 
@@ -31,6 +50,7 @@ def get_agent_config():
     )
 
 
+@cached_config
 def get_llm_config():
     model_id = getenv("llm_model_id")
     temperature = getenv("llm_temperature")
@@ -41,6 +61,7 @@ def get_llm_config():
     return dict(model_id=model_id, temperature=temperature)
 
 
+@cached_config
 def get_guardrails_config():
     model_id = getenv("guardrails_model_id")
     temperature = getenv("guardrails_temperature")
@@ -50,6 +71,7 @@ def get_guardrails_config():
     return dict(model_id=model_id, temperature=temperature)
 
 
+@cached_config
 def get_rag_config():
     embedding_api_base = getenv("embedding_api_base")
     retrieval_api_base = getenv("retrieval_api_base")
@@ -94,6 +116,7 @@ def get_rag_config():
     )
 
 
+@cached_config
 def get_tools_config():
     llm_model_id = getenv("tools_model_id")
     llm_api_base = getenv("tools_model_api_base")
@@ -123,6 +146,7 @@ def get_tools_config():
     )
 
 
+@cached_config
 def get_tracing_config():
     langfuse_public_key = getenv("langfuse_public_key")
     langfuse_secret_key = getenv("langfuse_secret_key")
@@ -153,6 +177,7 @@ def get_tracing_config():
     )
 
 
+@cached_config
 def get_logging_config():
     logging_level = getenv("logging_level")
     logging_format = getenv("logging_format")
@@ -160,6 +185,7 @@ def get_logging_config():
     return dict(logging_level=logging_level, logging_format=logging_format)
 
 
+@cached_config
 def get_email_config():
     smtp_host = getenv("smtp_host")
     smtp_port = getenv("smtp_port")
@@ -176,12 +202,14 @@ def get_email_config():
     )
 
 
+@cached_config
 def get_slack_config():
     slack_webhook_url = getenv("slack_webhook_url")
 
     return dict(slack_webhook_url=slack_webhook_url)
 
 
+@cached_config
 def get_database_config():
     db_user = getenv("PG_USER")
     db_password = getenv("PG_PASSWORD")
@@ -203,6 +231,7 @@ def get_database_config():
     )
 
 
+@cached_config
 def get_evaluation_database_config():
     """Get configuration for the evaluation database."""
     db_user = getenv("PG_USER")
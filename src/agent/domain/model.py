@@ -1,4 +1,5 @@
 import json
+from collections import deque
 from typing import Dict, List, Optional, Union
 
 import yaml
@@ -12,7 +13,7 @@ class BaseAgent:
     BaseAgent is the model logic for the agent. It's uses a state machine to process and propagate different commands.
     The update method is the main method that decides the next command based on the current state and the incoming command.
 
-    The events list is used to store outgoing events and will be picked up for notifications.
+    The events queue is used to store outgoing events and will be picked up for notifications.
     Is_answered is used to check if the agent has answered the question and stops the state machine.
     Previous_command is used to check if the command is a duplicate and stops the state machine.
 
@@ -45,7 +46,7 @@ class BaseAgent:
             raise ValueError("Question is required to enhance")
 
         self.kwargs = kwargs
-        self.events = []
+        self.events = deque()
         self.is_answered = False
 
         self.agent_memory = None
@@ -1,15 +1,72 @@
 import base64
+import functools
 import os
 
+import langfuse
 from openinference.instrumentation.smolagents import SmolagentsInstrumentor
 from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import SimpleSpanProcessor
 
 
+_tracing_enabled = False
+
+
+class _NullClient:
+    """Stand-in for the langfuse client while tracing is disabled."""
+
+    def update_current_trace(self, **kwargs):
+        pass
+
+
+_null_client = _NullClient()
+
+
+@functools.cache
+def _get_langfuse_client():
+    return langfuse.get_client()
+
+
+def get_client():
+    """
+    Get the langfuse client, or a client that ignores all updates when tracing is disabled.
+    """
+    if _tracing_enabled:
+        return _get_langfuse_client()
+    return _null_client
+
+
+def observe(func=None, **kwargs):
+    """
+    Wrap langfuse.observe and call the plain function when tracing is disabled.
+
+    The switch is checked per call, because the decorated modules are imported
+    before setup_tracing runs.
+    """
+
+    def decorator(func):
+        traced = langfuse.observe(**kwargs)(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **func_kwargs):
+            if _tracing_enabled:
+                return traced(*args, **func_kwargs)
+            return func(*args, **func_kwargs)
+
+        return wrapper
+
+    if func is None:
+        return decorator
+    return decorator(func)
+
+
 def setup_tracing(config: dict):
+    global _tracing_enabled
+
     telemetry_enabled = config.get("telemetry_enabled", "False")
     os.environ["TELEMETRY_ENABLED"] = telemetry_enabled
+    _tracing_enabled = telemetry_enabled == "true"
+    _get_langfuse_client.cache_clear()
 
     if telemetry_enabled == "true":
         LANGFUSE_AUTH = base64.b64encode(
@@ -1,12 +1,12 @@
 from typing import Union
 
-from langfuse import get_client, observe
 from loguru import logger
 
 from src.agent import config
 from src.agent.adapters.adapter import AbstractAdapter
 from src.agent.adapters.notifications import AbstractNotifications
 from src.agent.domain import commands, events, model, scenario_model, sql_model
+from src.agent.observability.tracing import get_client, observe
 
 
 class InvalidQuestion(Exception):
@@ -68,6 +68,30 @@ class TestAdapter:
         assert response.candidates[0].tag == "tag"
         assert response.candidates[0].name == "name"
 
+    @patch("src.agent.adapters.rag.BaseRAG.rerank")
+    def test_agent_rerank_many(self, mock_rerank):
+        candidates = [
+            commands.KBResponse(
+                description=description, id=str(i), tag="tag", name="name", score=0.0
+            )
+            for i, description in enumerate(["a", "bbb", "cc"])
+        ]
+        adapter = AgentAdapter()
+        adapter.rag.n_ranking_candidates = 2
+
+        mock_rerank.side_effect = lambda question, text: {
+            "question": question,
+            "text": text,
+            "score": float(len(text)),
+        }
+        question = commands.Rerank(question="test", q_id="1", candidates=candidates)
+
+        response = adapter.answer(question)
+
+        assert mock_rerank.call_count == 3
+        assert [c.id for c in response.candidates] == ["1", "2"]
+        assert [c.score for c in response.candidates] == [3.0, 2.0]
+
     @patch("src.agent.adapters.rag.BaseRAG.retrieve")
     @patch("src.agent.adapters.rag.BaseRAG.embed")
     def test_agent_retrieve(self, mock_embed, mock_retrieve):
@@ -2,6 +2,7 @@ from unittest.mock import patch
 
 import pandas as pd
 import pytest
+from sqlalchemy import text
 
 from src.agent.adapters.database import BaseDatabaseAdapter
 
@@ -44,3 +45,24 @@ class TestDatabase:
     def test_execute_query_no_engine(self, database_instance):
         result = database_instance.execute_query("SELECT * FROM your_table")
         assert result is None
+
+    def test_insert_batch_mixed_columns(self):
+        database = BaseDatabaseAdapter({"connection_string": "sqlite://"})
+        database.connect()
+
+        with database.engine.begin() as conn:
+            conn.execute(text('CREATE TABLE "results" (name TEXT, score REAL)'))
+
+        rows = [
+            {"name": "a", "score": 1.0},
+            {"name": "b"},
+            {"name": "c", "score": 3.0},
+        ]
+
+        assert database.insert_batch("results", rows)
+
+        result = database.execute_query('SELECT name, score FROM "results"')
+        assert sorted(result["data"]["name"]) == ["a", "b", "c"]
+        assert result["data"]["score"].isna().sum() == 1
+
+        database.disconnect()
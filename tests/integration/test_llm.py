@@ -42,3 +42,30 @@ class TestLLM:
 
         assert response.response == "Test response"
         assert response.chain_of_thought == "Test chain of thought"
+
+    @patch("src.agent.adapters.llm.instructor.from_litellm")
+    def test_llm_stream(self, mock_from_litellm):
+        mock_client = mock_from_litellm.return_value
+        partials = [
+            LLMResponseModel.model_construct(response=None, chain_of_thought="Test"),
+            LLMResponseModel(
+                response="Test response",
+                chain_of_thought="Test chain of thought",
+            ),
+        ]
+
+        mock_client.chat.completions.create_partial.return_value = iter(partials)
+
+        llm = LLM(
+            {
+                "model_id": "1",
+                "temperature": 0.5,
+            },
+        )
+
+        question = "What is the capital of France?"
+        responses = list(llm.stream(question, LLMResponseModel))
+
+        assert len(responses) == 2
+        assert responses[0].response is None
+        assert responses[-1].response == "Test response"
@@ -28,7 +28,7 @@ class TestRAG:
         assert rag_instance.n_ranking_candidates == 3
         assert rag_instance.retrieval_table == "test_table"
 
-    @patch("src.agent.adapters.rag.httpx.get")
+    @patch("src.agent.adapters.rag.httpx.Client.get")
     def test_embed(self, mock_get, rag_instance):
         mock_get.return_value = Mock(
             status_code=200, json=lambda: {"embedding": [0.1, 0.2, 0.3]}
@@ -37,7 +37,7 @@ class TestRAG:
 
         assert response == {"embedding": [0.1, 0.2, 0.3]}
 
-    @patch("src.agent.adapters.rag.httpx.get")
+    @patch("src.agent.adapters.rag.httpx.Client.get")
     def test_rerank(self, mock_get, rag_instance):
         mock_get.return_value = Mock(
             status_code=200,
@@ -61,7 +61,22 @@ class TestRAG:
             "name": "test_name",
         }
 
-    @patch("src.agent.adapters.rag.httpx.post")
+    @patch("src.agent.adapters.rag.httpx.Client.get")
+    def test_rerank_batch(self, mock_get, rag_instance):
+        mock_get.side_effect = lambda url, params, timeout: Mock(
+            status_code=200,
+            json=lambda: {"text": params["text"], "score": len(params["text"])},
+        )
+        response = rag_instance.rerank_batch("test_question", ["a", "bbb", "cc"])
+
+        assert response == [
+            {"text": "a", "score": 1},
+            {"text": "bbb", "score": 3},
+            {"text": "cc", "score": 2},
+        ]
+        assert mock_get.call_count == 3
+
+    @patch("src.agent.adapters.rag.httpx.Client.post")
     def test_retrieve(self, mock_post, rag_instance):
         mock_post.return_value = Mock(
             status_code=200,
@@ -99,13 +114,14 @@ class TestRAG:
             response=Mock(status_code=500, text="Internal Server Error"),
         )
 
-        with patch("httpx.get", return_value=mock_response):
+        with patch("httpx.Client.get", return_value=mock_response):
             result = rag_instance.embed("some text")
             assert result is None
 
     def test_request_error(self, rag_instance):
         with patch(
-            "httpx.get", side_effect=httpx.RequestError("Network Error", request=Mock())
+            "httpx.Client.get",
+            side_effect=httpx.RequestError("Network Error", request=Mock()),
         ):
             result = rag_instance.embed("some text")
             assert result is None
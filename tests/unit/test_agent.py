@@ -1,3 +1,4 @@
+from collections import deque
 from unittest.mock import patch
 
 import pytest
@@ -20,7 +21,8 @@ class TestAgent:
         assert agent.is_answered is False
         assert agent.previous_command is None
         assert agent.kwargs is not None
-        assert agent.events == []
+        assert isinstance(agent.events, deque)
+        assert agent.events == deque()
         assert agent.base_prompts is not None
 
     def test_agent_change_llm_response(self):
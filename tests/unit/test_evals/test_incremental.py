@@ -0,0 +1,75 @@
+from pathlib import Path
+
+import evals.incremental as incremental
+
+
+def make_tree(root: Path) -> Path:
+    """Minimal checkout with agent code, eval harness and one fixture file."""
+    (root / "src" / "agent").mkdir(parents=True)
+    (root / "src" / "agent" / "model.py").write_text("ANSWER = 1\n")
+
+    fixture_dir = root / "evals" / "tool_agent" / "e2e"
+    fixture_dir.mkdir(parents=True)
+    (root / "evals" / "llm_judge.py").write_text("THRESHOLD = 7.0\n")
+
+    fixture = fixture_dir / "e2e.yaml"
+    fixture.write_text("case:\n  expected: 42\n")
+    return fixture
+
+
+class TestSourceDigest:
+    def test_fixture_change_changes_digest(self, tmp_path):
+        fixture = make_tree(tmp_path)
+        before = incremental.compute_source_digest(tmp_path)
+
+        fixture.write_text("case:\n  expected: 43\n")
+
+        assert incremental.compute_source_digest(tmp_path) != before
+
+    def test_harness_change_changes_digest(self, tmp_path):
+        make_tree(tmp_path)
+        before = incremental.compute_source_digest(tmp_path)
+
+        (tmp_path / "evals" / "llm_judge.py").write_text("THRESHOLD = 8.0\n")
+
+        assert incremental.compute_source_digest(tmp_path) != before
+
+    def test_generated_files_are_ignored(self, tmp_path):
+        make_tree(tmp_path)
+        before = incremental.compute_source_digest(tmp_path)
+
+        (tmp_path / "evals" / ".fixture_cache").mkdir()
+        (tmp_path / "evals" / ".fixture_cache" / "parsed.json").write_text("{}")
+        (tmp_path / "evals" / "reports").mkdir()
+        (tmp_path / "evals" / "reports" / "report.json").write_text("{}")
+
+        assert incremental.compute_source_digest(tmp_path) == before
+
+
+class TestPassedCases:
+    def test_fixture_edit_invalidates_pass(self, tmp_path, monkeypatch):
+        fixture = make_tree(tmp_path / "repo")
+        test_file = tmp_path / "repo" / "evals" / "tool_agent" / "test_e2e.py"
+        test_file.write_text("def test_e2e(): pass\n")
+
+        monkeypatch.setenv("EVALS_INCREMENTAL_CACHE_DIR", str(tmp_path / "cache"))
+        monkeypatch.setattr(
+            incremental,
+            "get_source_digest",
+            lambda: incremental.compute_source_digest(tmp_path / "repo"),
+        )
+        incremental.get_passed_cache.cache_clear()
+
+        nodeid = "evals/tool_agent/test_e2e.py::test_e2e[case]"
+        case = {"question": "q"}
+
+        key = incremental.get_case_key(nodeid, test_file, case)
+        incremental.record_pass(key)
+        assert incremental.has_passed(incremental.get_case_key(nodeid, test_file, case))
+
+        fixture.write_text("case:\n  expected: 43\n")
+
+        assert not incremental.has_passed(
+            incremental.get_case_key(nodeid, test_file, case)
+        )
+        incremental.get_passed_cache.cache_clear()
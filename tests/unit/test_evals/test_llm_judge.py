@@ -0,0 +1,173 @@
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from evals.judge_cache import JudgeCache
+from evals.llm_judge import JudgeResult, JudgeScores, LLMJudge
+
+FULL_VERDICT = JudgeResult(
+    scores=JudgeScores(accuracy=3, relevance=9, completeness=9, hallucination=9),
+    reasoning={"accuracy": "Wrong value"},
+    overall_assessment="Inaccurate answer",
+    passed=False,
+)
+
+
+def make_partial(scores=None, reasoning=None, overall_assessment=None, passed=None):
+    """Partial judge response, as yielded while the verdict streams."""
+    return SimpleNamespace(
+        scores=SimpleNamespace(**scores) if scores is not None else None,
+        reasoning=reasoning,
+        overall_assessment=overall_assessment,
+        passed=passed,
+    )
+
+
+PASSING_SCORES = dict(accuracy=9, relevance=9, completeness=9, hallucination=9)
+
+
+def make_judge(llm, tmp_path, early_stop=True):
+    return LLMJudge(
+        llm=llm,
+        rate_limiter=Mock(),
+        cache=JudgeCache(tmp_path),
+        early_stop=early_stop,
+    )
+
+
+def make_llm():
+    """Fake judge LLM: the stream fails accuracy at once, use returns a full verdict."""
+    llm = Mock(model_id="judge")
+    llm.stream.return_value = iter(
+        [
+            SimpleNamespace(
+                scores=SimpleNamespace(
+                    accuracy=3, relevance=9, completeness=9, hallucination=9
+                ),
+                reasoning={},
+            )
+        ]
+    )
+    llm.use.return_value = FULL_VERDICT.model_copy(deep=True)
+    return llm
+
+
+class TestLLMJudge:
+    def test_early_stop_returns_stopped_verdict(self, tmp_path):
+        llm = make_llm()
+        judge = LLMJudge(
+            llm=llm,
+            rate_limiter=Mock(),
+            cache=JudgeCache(tmp_path),
+            early_stop=True,
+        )
+
+        result = judge.evaluate("question", "expected", "actual")
+
+        assert result.passed is False
+        assert result.reasoning == {}
+        assert result.overall_assessment.startswith("Stopped early")
+        llm.use.assert_not_called()
+
+    def test_full_evaluation_does_not_reuse_early_stopped_verdict(self, tmp_path):
+        llm = make_llm()
+        cache = JudgeCache(tmp_path)
+
+        stopped = LLMJudge(
+            llm=llm, rate_limiter=Mock(), cache=cache, early_stop=True
+        ).evaluate("question", "expected", "actual")
+        full = LLMJudge(
+            llm=llm, rate_limiter=Mock(), cache=cache, early_stop=False
+        ).evaluate("question", "expected", "actual")
+
+        assert stopped.overall_assessment.startswith("Stopped early")
+        assert llm.use.call_count == 1
+        assert full.reasoning == {"accuracy": "Wrong value"}
+        assert full.overall_assessment == "Inaccurate answer"
+
+    def test_full_verdict_is_cached(self, tmp_path):
+        llm = make_llm()
+        judge = LLMJudge(
+            llm=llm,
+            rate_limiter=Mock(),
+            cache=JudgeCache(tmp_path),
+            early_stop=False,
+        )
+
+        first = judge.evaluate("question", "expected", "actual")
+        second = judge.evaluate("question", "expected", "actual")
+
+        assert llm.use.call_count == 1
+        assert second == first
+
+
+class TestStreamJudge:
+    def test_passing_stream_returns_full_verdict(self, tmp_path):
+        llm = make_llm()
+        llm.stream.return_value = iter(
+            [
+                make_partial(scores=dict(accuracy=9)),
+                make_partial(scores=PASSING_SCORES, reasoning={}),
+                make_partial(
+                    scores=PASSING_SCORES,
+                    reasoning={"accuracy": "Correct"},
+                    overall_assessment="Good answer",
+                    passed=True,
+                ),
+            ]
+        )
+        judge = make_judge(llm, tmp_path)
+
+        result = judge.evaluate("question", "expected", "actual")
+
+        assert result.passed is True
+        assert result.scores.average_score == 9
+        assert result.overall_assessment == "Good answer"
+        llm.use.assert_not_called()
+
+    def test_empty_stream_falls_back_to_full_response(self, tmp_path):
+        llm = make_llm()
+        llm.stream.return_value = iter([])
+        judge = make_judge(llm, tmp_path)
+
+        result = judge.evaluate("question", "expected", "actual")
+
+        assert result.overall_assessment == "Inaccurate answer"
+        assert llm.use.call_count == 1
+        assert judge.rate_limiter.acquire.call_count == 2
+
+    def test_incomplete_final_partial_falls_back_to_full_response(self, tmp_path):
+        llm = make_llm()
+        llm.stream.return_value = iter(
+            [make_partial(scores=PASSING_SCORES, reasoning={"accuracy": "Correct"})]
+        )
+        judge = make_judge(llm, tmp_path)
+
+        result = judge.evaluate("question", "expected", "actual")
+
+        assert result.overall_assessment == "Inaccurate answer"
+        assert llm.use.call_count == 1
+
+    def test_stream_errors_propagate(self, tmp_path):
+        llm = make_llm()
+        llm.stream.side_effect = RuntimeError("connection reset")
+        judge = make_judge(llm, tmp_path)
+
+        with pytest.raises(RuntimeError):
+            judge.evaluate("question", "expected", "actual")
+
+        llm.use.assert_not_called()
+
+    def test_early_stop_is_read_when_the_judge_is_built(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("JUDGE_EARLY_STOP", "1")
+        judge = LLMJudge(
+            llm=make_llm(), rate_limiter=Mock(), cache=JudgeCache(tmp_path)
+        )
+        assert judge.early_stop is True
+
+        monkeypatch.setenv("JUDGE_EARLY_STOP", "0")
+        judge = LLMJudge(
+            llm=make_llm(), rate_limiter=Mock(), cache=JudgeCache(tmp_path)
+        )
+        assert judge.early_stop is False
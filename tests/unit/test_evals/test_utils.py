@@ -0,0 +1,98 @@
+import datetime
+import os
+
+import pytest
+
+from evals.utils import load_yaml_file, read_report, save_test_report
+
+RESULTS = [{"test_id": "q1", "passed": True, "score": 4.5}]
+MODEL_INFO = {"model_id": "test-model"}
+
+
+class TestReportRoundTrip:
+    def _save(self, tmp_path, monkeypatch, report_format):
+        monkeypatch.setenv("EVALS_REPORT_DIR", str(tmp_path))
+        monkeypatch.setenv("EVALS_REPORT_FORMAT", report_format)
+        monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+        monkeypatch.delenv("EVALS_DB_CONNECTION", raising=False)
+
+        save_test_report(RESULTS, "round_trip", MODEL_INFO)
+
+        (path,) = tmp_path.iterdir()
+        return path
+
+    def test_compressed_report_is_readable(self, tmp_path, monkeypatch):
+        path = self._save(tmp_path, monkeypatch, "json.gz")
+
+        assert path.name.endswith(".json.gz")
+        report = read_report(path)
+        assert report["test_suite"] == "round_trip"
+        assert report["model_info"] == MODEL_INFO
+        assert report["results"] == RESULTS
+        assert path.name == f"{report['run_id']}.json.gz"
+
+    def test_plain_report_is_readable(self, tmp_path, monkeypatch):
+        path = self._save(tmp_path, monkeypatch, "json")
+
+        assert path.suffix == ".json"
+        report = read_report(path)
+        assert report["results"] == RESULTS
+
+    def test_plain_json_is_the_default(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("EVALS_REPORT_DIR", str(tmp_path))
+        monkeypatch.delenv("EVALS_REPORT_FORMAT", raising=False)
+        monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+        monkeypatch.delenv("EVALS_DB_CONNECTION", raising=False)
+
+        save_test_report(RESULTS, "round_trip", MODEL_INFO)
+
+        (path,) = tmp_path.iterdir()
+        assert path.suffix == ".json"
+        assert read_report(path)["results"] == RESULTS
+
+
+class TestLoadYamlFile:
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path, monkeypatch):
+        cache_dir = tmp_path / "cache"
+        monkeypatch.setenv("EVALS_FIXTURE_CACHE_DIR", str(cache_dir))
+        return cache_dir
+
+    def test_warm_load_returns_cached_data(self, tmp_path, cache_dir):
+        yaml_file = tmp_path / "suite.yaml"
+        yaml_file.write_text("case:\n  question: How many pumps?\n")
+
+        cold = load_yaml_file(yaml_file)
+        warm = load_yaml_file(yaml_file)
+
+        assert warm == cold == {"case": {"question": "How many pumps?"}}
+        assert len(list(cache_dir.iterdir())) == 1
+
+    def test_dates_are_not_cached(self, tmp_path, cache_dir):
+        yaml_file = tmp_path / "suite.yaml"
+        yaml_file.write_text("created: 2024-05-01\n")
+
+        cold = load_yaml_file(yaml_file)
+        warm = load_yaml_file(yaml_file)
+
+        assert cold == warm == {"created": datetime.date(2024, 5, 1)}
+        assert not cache_dir.exists()
+
+    def test_non_string_keys_are_not_cached(self, tmp_path, cache_dir):
+        yaml_file = tmp_path / "suite.yaml"
+        yaml_file.write_text("1: first\n2: second\n")
+
+        assert load_yaml_file(yaml_file) == {1: "first", 2: "second"}
+        assert load_yaml_file(yaml_file) == {1: "first", 2: "second"}
+        assert not cache_dir.exists()
+
+    def test_edit_with_same_mtime_is_reparsed(self, tmp_path):
+        yaml_file = tmp_path / "suite.yaml"
+        yaml_file.write_text("answer: old\n")
+        stat = yaml_file.stat()
+        load_yaml_file(yaml_file)
+
+        yaml_file.write_text("answer: newer\n")
+        os.utime(yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert load_yaml_file(yaml_file) == {"answer": "newer"}
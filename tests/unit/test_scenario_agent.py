@@ -1,4 +1,5 @@
 import json
+from collections import deque
 
 import pytest
 
@@ -20,7 +21,8 @@ class TestScenarioAgent:
         assert agent.is_answered is False
         assert agent.previous_command is None
         assert agent.kwargs is not None
-        assert agent.events == []
+        assert isinstance(agent.events, deque)
+        assert agent.events == deque()
         assert agent.base_prompts is not None
         assert agent.sql_query is None
 
@@ -1,3 +1,5 @@
+from collections import deque
+
 import pandas as pd
 import pytest
 
@@ -19,7 +21,8 @@ class TestSQLAgent:
         assert agent.is_answered is False
         assert agent.previous_command is None
         assert agent.kwargs is not None
-        assert agent.events == []
+        assert isinstance(agent.events, deque)
+        assert agent.events == deque()
         assert agent.base_prompts is not None
         assert agent.sql_query is None
 
@@ -0,0 +1,83 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import src.agent.observability.tracing as tracing
+
+
+@pytest.fixture
+def fake_langfuse(monkeypatch):
+    langfuse = MagicMock()
+    langfuse.observe.return_value = lambda func: MagicMock(return_value="traced")
+    monkeypatch.setattr(tracing, "langfuse", langfuse)
+    tracing._get_langfuse_client.cache_clear()
+    yield langfuse
+    tracing._get_langfuse_client.cache_clear()
+
+
+class TestTracingDisabled:
+    @pytest.fixture(autouse=True)
+    def disable_tracing(self, monkeypatch):
+        monkeypatch.setattr(tracing, "_tracing_enabled", False)
+
+    def test_observe_calls_plain_function(self, fake_langfuse):
+        @tracing.observe(name="answer")
+        def answer(value):
+            return value * 2
+
+        assert answer(21) == 42
+        fake_langfuse.observe.assert_called_once_with(name="answer")
+
+    def test_observe_without_arguments(self, fake_langfuse):
+        @tracing.observe
+        def answer():
+            return "plain"
+
+        assert answer() == "plain"
+        assert answer.__name__ == "answer"
+
+    def test_update_current_trace_is_noop(self, fake_langfuse):
+        client = tracing.get_client()
+
+        assert client.update_current_trace(session_id="s1", tags=["t"]) is None
+        fake_langfuse.get_client.assert_not_called()
+
+
+class TestTracingEnabled:
+    @pytest.fixture(autouse=True)
+    def enable_tracing(self, monkeypatch):
+        monkeypatch.setattr(tracing, "_tracing_enabled", True)
+
+    def test_observe_delegates_to_langfuse(self, fake_langfuse):
+        @tracing.observe()
+        def answer():
+            return "plain"
+
+        assert answer() == "traced"
+
+    def test_get_client_returns_langfuse_client(self, fake_langfuse):
+        client = tracing.get_client()
+
+        assert client is fake_langfuse.get_client.return_value
+        client.update_current_trace(session_id="s1")
+        client.update_current_trace.assert_called_once_with(session_id="s1")
+
+    def test_switch_is_read_per_call(self, fake_langfuse, monkeypatch):
+        @tracing.observe()
+        def answer():
+            return "plain"
+
+        assert answer() == "traced"
+        monkeypatch.setattr(tracing, "_tracing_enabled", False)
+        assert answer() == "plain"
+
+
+class TestSetupTracing:
+    def test_disabled_config_turns_tracing_off(self, monkeypatch):
+        monkeypatch.setattr(tracing, "_tracing_enabled", True)
+
+        with patch.dict("os.environ", {}, clear=False):
+            tracing.setup_tracing({"telemetry_enabled": "false"})
+
+        assert tracing._tracing_enabled is False
+        assert isinstance(tracing.get_client(), tracing._NullClient)